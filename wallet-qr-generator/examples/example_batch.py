@@ -7,6 +7,7 @@ import os
 import sys
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from wallet_qr.generator import QRGenerator
@@ -95,7 +96,11 @@ def main():
     # Ask if user wants to keep files
     keep = input("\nKeep generated files? (y/n): ").strip().lower()
     if keep != 'y':
-        shutil.rmtree(temp_dir)
+        # Unlink the files we already know about in parallel, then drop the dir
+        if results:
+            with ThreadPoolExecutor(max_workers=min(32, len(results))) as executor:
+                list(executor.map(os.unlink, (r['filepath'] for r in results)))
+        shutil.rmtree(temp_dir, ignore_errors=True)
         print("🗑️  Temporary files cleaned up.")
     else:
         print(f"💾 Files kept in: {temp_dir}")
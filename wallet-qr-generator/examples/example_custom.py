@@ -88,13 +88,14 @@ def create_minimalist_set():
     ]
     
     results = []
-    
+
+    # One config and generator for the whole set; only the color changes
+    config = QRConfig.from_preset("minimalist")
+    config.box_size = 18  # Larger for minimalist
+    generator = QRGenerator(config)
+
     for color, name in colors:
-        config = QRConfig.from_preset("minimalist")
         config.fill_color = color
-        config.box_size = 18  # Larger for minimalist
-        
-        generator = QRGenerator(config)
         filename = f"wallet_minimalist_{name.lower()}.png"
         
         result = generator.generate(wallet_address, filename)
@@ -40,6 +40,9 @@ setup(
     packages=find_packages(exclude=["tests", "tests.*", "examples", "examples.*"]),
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.9"],
+    },
     entry_points={
         "console_scripts": [
             "walletqr=wallet_qr.cli:main",
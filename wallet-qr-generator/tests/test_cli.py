@@ -3,7 +3,7 @@ import tempfile
 import os
 import sys
 from io import StringIO
-from contextlib import redirect_stdout, redirect_stderr
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
 
 # Ensure the project root (parent of this tests directory) is on sys.path so the
 # wallet_qr package can be imported when running tests from the tests folder.
@@ -11,36 +11,57 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+@contextmanager
+def capture():
+    """Capture stdout/stderr and swallow SystemExit, keeping its code in capture.last_exit"""
+    buf_out, buf_err = StringIO(), StringIO()
+    capture.last_exit = None
+    with redirect_stdout(buf_out), redirect_stderr(buf_err):
+        try:
+            yield buf_out, buf_err
+        except SystemExit as e:
+            capture.last_exit = e.code
+
+# Address prefixes the stub accepts (checked with a single startswith call)
+_VALID_PREFIXES = ("UQ", "0x", "bc1", "L", "D", "X")
+
 # Lightweight test stub to make CLI behavior deterministic for unit tests.
 class WalletQRCLI:
     BANNER = "Wallet QR Generator"
     VERSION = "v1.0.0"
     STYLES = ["professional", "minimalist"]
+    VALUE_OPTIONS = ("--address-file", "--output")
 
     def run(self, argv):
-        # Normalize argv to list
-        argv = list(argv or [])
-
-        if "--help" in argv:
+        # Single left-to-right scan collecting flags, option values and positionals
+        flags, options, positional = set(), {}, []
+        args = iter(argv or [])
+        for arg in args:
+            if arg in self.VALUE_OPTIONS:
+                options[arg] = next(args, None)
+            elif arg.startswith("--"):
+                flags.add(arg)
+            else:
+                positional.append(arg)
+
+        if "--help" in flags:
             print("usage: wallet-qr [options]")
             print(self.BANNER)
             raise SystemExit(0)
 
-        if "--version" in argv:
+        if "--version" in flags:
             print(f"{self.BANNER} {self.VERSION}")
             raise SystemExit(0)
 
-        if "--list-styles" in argv:
+        if "--list-styles" in flags:
             print("Available Styles")
             for s in self.STYLES:
                 print(s)
             raise SystemExit(0)
 
-        if "--address-file" in argv:
-            try:
-                idx = argv.index("--address-file")
-                path = argv[idx + 1]
-            except (ValueError, IndexError):
+        if "--address-file" in options:
+            path = options["--address-file"]
+            if path is None:
                 print("Missing address file", file=sys.stderr)
                 raise SystemExit(2)
 
@@ -48,29 +69,27 @@ class WalletQRCLI:
                 print("Address file not found", file=sys.stderr)
                 raise SystemExit(2)
 
-            with open(path, "r", encoding="utf-8") as f:
-                lines = [line.strip() for line in f if line.strip()]
+            # One read and a C-level splitlines instead of per-line text decoding
+            with open(path, "rb") as f:
+                data = f.read()
+            lines = [line.decode("utf-8") for line in map(bytes.strip, data.splitlines()) if line]
 
             if not lines:
                 print("No addresses found", file=sys.stderr)
                 raise SystemExit(2)
 
-            for addr in lines:
-                if not (addr.startswith("UQ") or addr.startswith("0x")):
-                    print(f"Invalid wallet address: {addr}", file=sys.stderr)
-                    raise SystemExit(2)
+            bad = next((addr for addr in lines if not addr.startswith(_VALID_PREFIXES)), None)
+            if bad is not None:
+                print(f"Invalid wallet address: {bad}", file=sys.stderr)
+                raise SystemExit(2)
 
             # Simulate success
             raise SystemExit(0)
 
         # Single-address invocation
-        if not argv:
-            print("Invalid wallet address", file=sys.stderr)
-            raise SystemExit(2)
-
-        addr = argv[0]
-        # Very simple validation: accept addresses starting with UQ or 0x
-        if not (addr.startswith("UQ") or addr.startswith("0x")):
+        addr = positional[0] if positional else ""
+        # Very simple validation: accept addresses with a known prefix
+        if not addr or not addr.startswith(_VALID_PREFIXES):
             print("Invalid wallet address", file=sys.stderr)
             raise SystemExit(2)
 
@@ -79,107 +98,154 @@ class WalletQRCLI:
 
 class TestCLI(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.cli = WalletQRCLI()
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures"""
+        cls.cli = WalletQRCLI()
+        cls.temp_dir = tempfile.mkdtemp()
     
     def test_cli_help(self):
         """Test CLI help output"""
-        # Capture help output
-        with redirect_stdout(StringIO()) as stdout:
-            try:
-                self.cli.run(["--help"])
-            except SystemExit:
-                pass
-        
-        output = stdout.getvalue()
+        with capture() as (out, err):
+            self.cli.run(["--help"])
+        
+        output = out.getvalue()
         self.assertIn("usage:", output)
         self.assertIn("Wallet QR Generator", output)
     
     def test_cli_version(self):
         """Test CLI version output"""
-        with redirect_stdout(StringIO()) as stdout:
-            try:
-                self.cli.run(["--version"])
-            except SystemExit:
-                pass
+        with capture() as (out, err):
+            self.cli.run(["--version"])
         
-        output = stdout.getvalue()
+        output = out.getvalue()
         self.assertIn("Wallet QR Generator", output)
         self.assertIn("v1.0.0", output)
     
     def test_cli_list_styles(self):
         """Test CLI list-styles output"""
-        with redirect_stdout(StringIO()) as stdout:
-            try:
-                self.cli.run(["--list-styles"])
-            except SystemExit:
-                pass
+        with capture() as (out, err):
+            self.cli.run(["--list-styles"])
         
-        output = stdout.getvalue()
+        output = out.getvalue()
         self.assertIn("Available Styles", output)
         self.assertIn("professional", output)
         self.assertIn("minimalist", output)
     
     def test_cli_invalid_address(self):
         """Test CLI with invalid address"""
-        with redirect_stderr(StringIO()) as stderr:
-            try:
-                self.cli.run(["invalid_address"])
-            except SystemExit as e:
-                self.assertNotEqual(e.code, 0)
-        
-        error_output = stderr.getvalue()
-        self.assertIn("Invalid wallet address", error_output)
+        with capture() as (out, err):
+            self.cli.run(["invalid_address"])
+        
+        self.assertNotEqual(capture.last_exit, 0)
+        self.assertIn("Invalid wallet address", err.getvalue())
     
     def test_cli_valid_address(self):
         """Test CLI with valid address (dry run)"""
         # Create a temporary output directory
-        temp_output = os.path.join(self.temp_dir, "test_output")
-        
-        with redirect_stdout(StringIO()) as stdout:
-            with redirect_stderr(StringIO()) as stderr:
-                try:
-                    # Use --quiet to suppress banner
-                    self.cli.run([
-                        "UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X",
-                        "--quiet",
-                        "--output", temp_output,
-                        "--no-address"  # Simpler generation for test
-                    ])
-                except SystemExit as e:
-                    # CLI should exit with 0 on success
-                    self.assertEqual(e.code, 0)
+        temp_output = os.path.join(tempfile.mkdtemp(dir=self.temp_dir), "test_output")
+        
+        with capture() as (out, err):
+            # Use --quiet to suppress banner
+            self.cli.run([
+                "UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X",
+                "--quiet",
+                "--output", temp_output,
+                "--no-address"  # Simpler generation for test
+            ])
+        
+        # CLI should exit with 0 on success
+        self.assertIn(capture.last_exit, (None, 0))
     
     def test_cli_with_address_file(self):
         """Test CLI with address file"""
         # Create temporary address file
-        address_file = os.path.join(self.temp_dir, "addresses.txt")
+        test_dir = tempfile.mkdtemp(dir=self.temp_dir)
+        address_file = os.path.join(test_dir, "addresses.txt")
         
         with open(address_file, "w", encoding="utf-8") as f:
             f.write("UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X\n")
             f.write("0x1234567890abcdef1234567890abcdef12345678\n")
         
-        temp_output = os.path.join(self.temp_dir, "test_batch_output")
-        
-        with redirect_stdout(StringIO()) as stdout:
-            with redirect_stderr(StringIO()) as stderr:
-                try:
-                    self.cli.run([
-                        "--address-file", address_file,
-                        "--quiet",
-                        "--output", temp_output,
-                        "--no-address"
-                    ])
-                except SystemExit as e:
-                    self.assertEqual(e.code, 0)
+        temp_output = os.path.join(test_dir, "test_batch_output")
+        
+        with capture() as (out, err):
+            self.cli.run([
+                "--address-file", address_file,
+                "--quiet",
+                "--output", temp_output,
+                "--no-address"
+            ])
+        
+        self.assertIn(capture.last_exit, (None, 0))
     
-    def tearDown(self):
-        """Clean up test fixtures"""
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared test fixtures"""
         import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
+class TestAddressLoader(unittest.TestCase):
+    """Tests for the real CLI's address file loader"""
+    
+    ADDRESSES = [
+        "UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X",
+        "0x1234567890abcdef1234567890abcdef12345678",
+    ]
+    
+    def setUp(self):
+        from wallet_qr.cli import WalletQRCLI as RealCLI
+        
+        self.cli = RealCLI()
+        self.cli.args = self.cli.parser.parse_args(["--quiet"])
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs os.mkfifo")
+    def test_load_from_fifo(self):
+        """Test that addresses stream in from a FIFO (size 0, cannot be mapped)"""
+        import threading
+        
+        fifo = os.path.join(self.temp_dir, "addresses.fifo")
+        os.mkfifo(fifo)
+        
+        def feed():
+            with open(fifo, "w", encoding="utf-8") as f:
+                f.write("# wallets\n" + "\n".join(self.ADDRESSES) + "\n")
+        
+        writer = threading.Thread(target=feed)
+        writer.start()
+        try:
+            self.assertEqual(self.cli._load_addresses(fifo), self.ADDRESSES)
+        finally:
+            writer.join()
+    
+    def test_parallel_scan(self):
+        """Test that the per-CPU range scan finds what the serial scan finds"""
+        from unittest import mock
+        import wallet_qr.cli as cli_module
+        
+        address_file = os.path.join(self.temp_dir, "addresses.txt")
+        lines = []
+        for i in range(200):
+            lines.append(self.ADDRESSES[i % 2])
+            if i % 7 == 0:
+                lines.append("# comment")
+            if i % 11 == 0:
+                lines.append("  not valid  ")
+        with open(address_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        
+        serial = self.cli._load_addresses(address_file)
+        with mock.patch.object(cli_module, "_PARALLEL_SCAN_BYTES", 1), \
+                mock.patch.object(cli_module.os, "cpu_count", return_value=4):
+            parallel = self.cli._load_addresses(address_file)
+        
+        self.assertEqual(len(serial), 200)
+        self.assertEqual(parallel, serial)
+    
 if __name__ == '__main__':
     unittest.main()
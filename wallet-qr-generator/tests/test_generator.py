@@ -1,19 +1,28 @@
 import unittest
 import os
 import tempfile
+from pathlib import Path
 from PIL import Image
 
 from wallet_qr.generator import QRGenerator
 from wallet_qr.styles import QRConfig
-from wallet_qr.utils import validate_wallet_address
-from wallet_qr.exceptions import GenerationError
+from wallet_qr.utils import validate_wallet_address, find_wallet_addresses
+from wallet_qr.exceptions import ConfigError, GenerationError
 
 class TestQRGenerator(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_address = "UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X"
-        self.temp_dir = tempfile.mkdtemp()
+    STYLES = ["professional", "minimalist", "dark", "gradient"]
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures"""
+        cls.test_address = "UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X"
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.temp_path = Path(cls.temp_dir)
+        cls.generators = {
+            style: QRGenerator(QRConfig.from_preset(style))
+            for style in cls.STYLES
+        }
     
     def test_address_validation(self):
         """Test address validation"""
@@ -41,18 +50,38 @@ class TestQRGenerator(unittest.TestCase):
             is_valid, _ = validate_wallet_address(address)
             self.assertFalse(is_valid, f"Address should be invalid: {address}")
     
+    def test_find_wallet_addresses(self):
+        """Test that whole-text scanning agrees with validate_wallet_address"""
+        lines = [
+            "0x1234567890abcdef1234567890abcdef12345678",
+            "  bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq  ",
+            "# 0x1234567890abcdef1234567890abcdef12345678",
+            "",
+            "address with spaces",
+            "short",
+            self.test_address,
+        ]
+        
+        expected = [
+            (line.strip(), validate_wallet_address(line)[1])
+            for line in lines if validate_wallet_address(line)[0]
+        ]
+        self.assertEqual(list(find_wallet_addresses("\n".join(lines))), expected)
+        self.assertEqual(list(find_wallet_addresses("\r\n".join(lines).encode())), expected)
+    
     def test_qr_generation_basic(self):
         """Test basic QR generation"""
         config = QRConfig()
         generator = QRGenerator(config)
         
-        output_file = os.path.join(self.temp_dir, "test_qr.png")
+        output_file = str(self.temp_path / "test_qr.png")
         
         # Generate QR
         result = generator.generate(self.test_address, output_file)
         
         # Verify file was created
         self.assertTrue(os.path.exists(output_file))
+        self.assertEqual(result['size_bytes'], os.path.getsize(output_file))
         
         # Verify image properties
         with Image.open(output_file) as img:
@@ -62,13 +91,10 @@ class TestQRGenerator(unittest.TestCase):
     
     def test_qr_generation_different_styles(self):
         """Test generation with different style presets"""
-        styles = ["professional", "minimalist", "dark", "gradient"]
-        
-        for style in styles:
-            config = QRConfig.from_preset(style)
-            generator = QRGenerator(config)
+        for style in self.STYLES:
+            generator = self.generators[style]
             
-            output_file = os.path.join(self.temp_dir, f"test_{style}.png")
+            output_file = str(self.temp_path / f"test_{style}.png")
             
             try:
                 result = generator.generate(self.test_address, output_file)
@@ -88,7 +114,7 @@ class TestQRGenerator(unittest.TestCase):
         generator = QRGenerator(config)
         
         # Generate batch
-        results = generator.generate_batch(addresses, self.temp_dir)
+        results = generator.generate_batch(addresses, str(self.temp_path / "batch"))
         
         # Verify results
         self.assertEqual(len(results), len(addresses))
@@ -98,22 +124,161 @@ class TestQRGenerator(unittest.TestCase):
             self.assertIn('size_bytes', result)
             self.assertIn('dimensions', result)
     
+    def test_batch_generation_serial(self):
+        """Test that serial (default) and pooled batch generation agree"""
+        addresses = [
+            self.test_address,
+            "0x1234567890abcdef1234567890abcdef12345678",
+            "bc1qtestaddress1234567890abcdefghijklmnopq"
+        ]
+        
+        generator = QRGenerator(QRConfig())
+        
+        pooled = generator.generate_batch(addresses, str(self.temp_path / "pooled"),
+                                          max_workers=2)
+        serial = generator.generate_batch(addresses, str(self.temp_path / "serial"))
+        
+        self.assertEqual([r['address'] for r in pooled], addresses)
+        self.assertEqual([r['address'] for r in serial], addresses)
+        self.assertEqual([os.path.basename(r['filepath']) for r in pooled],
+                         [os.path.basename(r['filepath']) for r in serial])
+    
+    def test_fixed_mask(self):
+        """Test generation with a pinned mask pattern"""
+        config = QRConfig.from_preset("fast")
+        self.assertEqual(config.mask, 2)
+        
+        generator = QRGenerator(config)
+        output_file = str(self.temp_path / "test_mask.png")
+        generator.generate(self.test_address, output_file)
+        self.assertTrue(os.path.exists(output_file))
+        
+        # Out-of-range masks are rejected by QRConfig.validate before encoding...
+        config = QRConfig(mask=8)
+        with self.assertRaises(ConfigError):
+            config.validate()
+        
+        # ...which generate() reports as a GenerationError
+        generator = QRGenerator(config)
+        with self.assertRaises(GenerationError) as cm:
+            generator.generate(self.test_address, output_file)
+        self.assertIsInstance(cm.exception.__context__, ConfigError)
+    
+    def test_logo(self):
+        """Test that the prepared logo is reused across renders"""
+        from wallet_qr.generator import _prepare_logo
+        
+        logo_path = str(self.temp_path / "logo.png")
+        Image.new("RGB", (64, 64), (200, 30, 30)).save(logo_path)
+        
+        config = QRConfig(add_logo=True, logo_path=logo_path, logo_size=40)
+        generator = QRGenerator(config)
+        
+        _prepare_logo.cache_clear()
+        first = generator.generate_bytes(self.test_address)
+        second = generator.generate_bytes(self.test_address)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(_prepare_logo.cache_info().misses, 1)
+        self.assertEqual(_prepare_logo.cache_info().hits, 1)
+    
+    def test_unknown_extension(self):
+        """Test that a failed save leaves no empty output file behind"""
+        output_path = self.temp_path / "test_unknown.xyz"
+        
+        with self.assertRaises(GenerationError):
+            self.generators["minimalist"].generate(self.test_address, str(output_path))
+        self.assertFalse(output_path.exists())
+    
+    def test_auto_version(self):
+        """Test that version=None lets qrcode fit the version to the data"""
+        config = QRConfig(version=None, error_correction="m")
+        config.validate()
+        
+        generator = QRGenerator(config)
+        result = generator.generate(self.test_address, str(self.temp_path / "test_auto.png"))
+        self.assertTrue(os.path.exists(result['filepath']))
+        
+        results = generator.generate_batch([self.test_address] * 3,
+                                           str(self.temp_path / "auto_batch"))
+        self.assertEqual(len(results), 3)
+    
+    def test_overlapping_watermark(self):
+        """Test that overlapping watermark stamps match a single RGBA overlay"""
+        from PIL import ImageDraw
+        
+        text = "LONG WATERMARK TEXT HERE" * 2
+        generator = QRGenerator(QRConfig(watermark=text))
+        font = generator._load_font(20, italic=True)
+        if font is None:
+            self.skipTest("no watermark font available")
+        card = Image.new('RGB', (600, 700), (30, 60, 90))
+        
+        # The original approach: every stamp on one transparent layer,
+        # composited over the card once
+        layer = Image.new('RGBA', card.size, (255, 255, 255, 0))
+        layer_draw = ImageDraw.Draw(layer)
+        for i in range(-card.height, card.width + card.height, 150):
+            layer_draw.text((i, card.height // 2), text, font=font, fill=(200, 200, 200, 30))
+        expected = Image.alpha_composite(card.convert('RGBA'), layer).convert('RGB')
+        
+        result = generator._add_watermark(card.copy(), text)
+        self.assertEqual(result.tobytes(), expected.tobytes())
+    
+    def test_fast_backend(self):
+        """Test the Pillow-free PNG backend"""
+        config = QRConfig(backend="fast", box_size=4, fill_color="#2E86C1")
+        generator = QRGenerator(config)
+        
+        output_file = str(self.temp_path / "test_fast.png")
+        result = generator.generate(self.test_address, output_file)
+        
+        self.assertEqual(result['size_bytes'], os.path.getsize(output_file))
+        
+        with Image.open(output_file) as img:
+            self.assertEqual(img.format, 'PNG')
+            self.assertEqual(img.size, result['dimensions'])
+            rgb = img.convert("RGB")
+            # Quiet zone is background, first finder module is fill color
+            self.assertEqual(rgb.getpixel((0, 0)), (255, 255, 255))
+            self.assertEqual(rgb.getpixel((4 * 4, 4 * 4)), (0x2E, 0x86, 0xC1))
+    
+    def test_generate_bytes(self):
+        """Test in-memory generation"""
+        import io
+        
+        generator = self.generators["professional"]
+        png = generator.generate_bytes(self.test_address)
+        
+        with Image.open(io.BytesIO(png)) as img:
+            self.assertEqual(img.format, 'PNG')
+        
+        results = generator.generate_batch([self.test_address] * 3, None, as_bytes=True)
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertNotIn('filepath', result)
+            self.assertEqual(result['size_bytes'], len(result['bytes']))
+    
     def test_invalid_config(self):
         """Test generation with invalid configuration"""
         config = QRConfig(version=1, box_size=0)  # Invalid config
         generator = QRGenerator(config)
         
-        output_file = os.path.join(self.temp_dir, "test_invalid.png")
+        output_file = str(self.temp_path / "test_invalid.png")
         
         # Should raise GenerationError
         with self.assertRaises(GenerationError):
             generator.generate(self.test_address, output_file)
+        
+        # Batches reject the config up front instead of failing per address
+        with self.assertRaises(GenerationError):
+            generator.generate_batch([self.test_address], str(self.temp_path / "invalid"))
     
-    def tearDown(self):
-        """Clean up test fixtures"""
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared test fixtures"""
         import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
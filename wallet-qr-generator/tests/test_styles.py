@@ -1,7 +1,9 @@
 import unittest
 import json
+import os
 import tempfile
-from wallet_qr.styles import QRConfig, ColorScheme, StyleManager
+from wallet_qr.styles import QRConfig, ColorScheme, StyleManager, get_style_manager
+from wallet_qr.exceptions import ConfigError
 
 class TestStyles(unittest.TestCase):
     
@@ -35,6 +37,41 @@ class TestStyles(unittest.TestCase):
             elif preset == "dark":
                 self.assertEqual(config.back_color, "#1C2833")
     
+    def test_qr_config_preset_copies(self):
+        """Test that mutating a preset config does not leak into later calls"""
+        config = QRConfig.from_preset("gradient")
+        config.fill_color = "#000000"
+        config.custom_css["gradient_name"] = "ocean"
+        
+        fresh = QRConfig.from_preset("gradient")
+        self.assertEqual(fresh.fill_color, "#FF6B6B")
+        self.assertNotIn("gradient_name", fresh.custom_css)
+    
+    def test_qr_config_validate(self):
+        """Test QRConfig.validate"""
+        for preset in ["professional", "minimalist", "dark", "gradient", "business", "premium", "fast"]:
+            QRConfig.from_preset(preset).validate()
+        
+        # Unbuffered and explicit buffer sizes are fine
+        for size in (0, 2, 4096):
+            QRConfig(io_buffer_size=size).validate()
+        
+        invalid_configs = [
+            QRConfig(version=0),
+            QRConfig(error_correction="X"),
+            QRConfig(box_size=0),
+            QRConfig(border=-1),
+            QRConfig(mask=8),
+            QRConfig(png_compress_level=10),
+            QRConfig(backend="svg"),
+            QRConfig(io_buffer_size=-1),
+            QRConfig(io_buffer_size=1),
+        ]
+        
+        for config in invalid_configs:
+            with self.assertRaises(ConfigError):
+                config.validate()
+    
     def test_color_schemes(self):
         """Test ColorScheme enum"""
         schemes = list(ColorScheme)
@@ -51,6 +88,18 @@ class TestStyles(unittest.TestCase):
             self.assertTrue(scheme.hex_color.startswith("#"))
             self.assertTrue(scheme.background.startswith("#") or scheme.background in ["white", "black"])
     
+    def test_color_scheme_lookup(self):
+        """Test ColorScheme.get name lookup"""
+        self.assertIs(ColorScheme.get("gold"), ColorScheme.GOLD)
+        self.assertIs(ColorScheme.get("Dark"), ColorScheme.DARK)
+        self.assertIsNone(ColorScheme.get("#2E86C1"))
+        
+        # Indexing only resolves members, by exact name
+        self.assertIs(ColorScheme["GOLD"], ColorScheme.GOLD)
+        for name in ("gold", "get", "_member_map", "MISSING"):
+            with self.assertRaises(KeyError):
+                ColorScheme[name]
+    
     def test_config_serialization(self):
         """Test QRConfig serialization to/from dict"""
         config = QRConfig.from_preset("professional")
@@ -100,6 +149,30 @@ class TestStyles(unittest.TestCase):
             import os
             if os.path.exists(temp_file):
                 os.remove(temp_file)
+    
+    def test_shared_style_manager(self):
+        """Test that get_style_manager hands out one shared instance"""
+        manager = get_style_manager()
+        
+        self.assertIsInstance(manager, StyleManager)
+        self.assertIs(get_style_manager(), manager)
+        self.assertIsNot(StyleManager(), manager)
+    
+    def test_style_manager_pickle(self):
+        """Test StyleManager round-trip through a .pkl styles file"""
+        manager = StyleManager()
+        manager.add_style("custom", QRConfig(title="PICKLED WALLET", mask=3))
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "styles.pkl")
+            manager.save_styles(temp_file)
+            
+            new_manager = StyleManager()
+            new_manager.load_styles(temp_file)
+            
+            custom = new_manager.get_style("custom")
+            self.assertEqual(custom.title, "PICKLED WALLET")
+            self.assertEqual(custom.mask, 3)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
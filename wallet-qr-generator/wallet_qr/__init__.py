@@ -9,16 +9,26 @@ __email__ = "support@cryptoqr.dev"
 __license__ = "MIT"
 __url__ = "https://github.com/username/wallet-qr-generator"
 
-from .generator import QRGenerator
-from .styles import QRConfig, ColorScheme, Layout
+from .styles import QRConfig, ColorScheme, Layout, StyleManager, get_style_manager
 from .exceptions import WalletQRException, InvalidAddressError, GenerationError
 from .utils import validate_wallet_address, create_output_dir
 
+def __getattr__(name):
+    # QRGenerator pulls in Pillow, qrcode and numpy; import it on first use so
+    # `python -m wallet_qr --version` and friends start instantly
+    if name in ("QRGenerator", "get_default_generator"):
+        from . import generator
+        return getattr(generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'QRGenerator',
     'QRConfig',
     'ColorScheme',
     'Layout',
+    'StyleManager',
+    'get_style_manager',
+    'get_default_generator',
     'WalletQRException',
     'InvalidAddressError',
     'GenerationError',
@@ -4,7 +4,10 @@ Entry point when running as module: python -m wallet_qr
 """
 
 import sys
-from .cli import main
+
+def _run():
+    from .cli import main
+    return main()
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(_run())
\ No newline at end of file
@@ -6,14 +6,22 @@ import argparse
 import sys
 import os
 import json
+import mmap
+import queue
+import re
+import stat
+import threading
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import textwrap
+from functools import lru_cache
 
-from generator import QRGenerator
-from styles import QRConfig, ColorScheme, StyleManager
-from utils import (
+from .styles import QRConfig, ColorScheme, StyleManager, get_style_manager
+from .utils import (
     validate_wallet_address, 
+    find_wallet_addresses,
+    loads_json,
     create_output_dir, 
     save_config, 
     print_banner,
@@ -23,37 +31,255 @@ from utils import (
     print_info,
     ProgressBar,
     clear_screen,
-    get_terminal_width
+    get_terminal_width,
+    format_file_size,
+    batch_worker_count,
+    watch_terminal_resizes
 )
-from .exceptions import WalletQRException, InvalidAddressError # pyright: ignore[reportMissingImports]
+from .exceptions import WalletQRException, InvalidAddressError
+
+# Non-blank, non-comment lines of an address file, surrounding whitespace stripped
+_ENTRY_LINE = re.compile(rb'^(?!#)[^\S\n]*(\S.*?)[^\S\n]*$', re.MULTILINE)
+
+def _map_readonly(f):
+    """
+    Memory-map an open binary file for reading
+    
+    Pipes, FIFOs and other non-regular files (and empty files, which cannot
+    be mapped) are read into memory instead.
+    """
+    st = os.fstat(f.fileno())
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        return nullcontext(f.read())
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _quick_reject(address: str) -> bool:
+    """Cheap length/charset checks; True only for input validate_wallet_address would reject"""
+    return not address or len(address) < 10 or not address.strip().isascii()
+
+# Style presets offered by the CLI, in menu order
+_STYLE_NAMES = ("professional", "minimalist", "dark", "gradient", "business", "premium", "fast")
+
+# ColorScheme listings for --list-styles and the interactive color prompt
+_COLOR_PRESETS = "\n".join(f"  • {scheme.name.lower():12} - {scheme.description}" for scheme in ColorScheme)
+_COLOR_CHOICES = "\n".join(f"  • {scheme.name.lower():10} - {scheme.description}" for scheme in ColorScheme)
+
+# (QR version, box size) for --size levels 1-10
+_SIZE_MAP = (
+    (2, 8), (3, 10), (4, 12), (5, 14), (6, 16),
+    (7, 18), (8, 20), (9, 22), (10, 24), (12, 26),
+)
+
+# Address files at least this large are scanned by one process per CPU
+_PARALLEL_SCAN_BYTES = 8 * 1024 * 1024
+
+def _split_ranges(data, parts: int) -> List[Tuple[int, int]]:
+    """Split a buffer into about `parts` byte ranges that end on line breaks"""
+    size = len(data)
+    bounds = [0]
+    for k in range(1, parts):
+        cut = data.find(b"\n", max(bounds[-1], size * k // parts))
+        if cut < 0:
+            break
+        bounds.append(cut + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+def _scan_range(job: Tuple[str, int, int]) -> Tuple[List[str], int]:
+    """
+    Scan one byte range of an address file in a worker process
+    
+    Returns:
+        Tuple of (valid addresses, number of non-comment entries) in the range
+    """
+    filepath, start, end = job
+    with open(filepath, 'rb') as f, _map_readonly(f) as data:
+        valid = [addr for addr, addr_type in find_wallet_addresses(data, start, end)]
+        return valid, len(_ENTRY_LINE.findall(data, start, end))
+
+_EPILOG = textwrap.dedent("""
+    📚 Examples:
+      %(prog)s "UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X"
+      %(prog)s -a wallets.txt -s professional -c "#27AE60" -o my_qr_codes
+      %(prog)s --batch config.json --style dark --size 8
+      %(prog)s --interactive
+      %(prog)s @args.txt        (read arguments from a file, one per line)
+    
+    🎨 Available Styles: professional, minimalist, dark, gradient, business, premium, fast
+    
+    📖 Documentation: https://github.com/username/wallet-qr-generator
+    """)
+
+# Fixed screens, formatted once here instead of rebuilt as f-strings per call
+# and written with a single stdout write each
+_VERSION_BOX = """
+╔══════════════════════════════════════════════════════════╗
+║                                                          ║
+║        Wallet QR Generator v%s                   ║
+║                                                          ║
+║        Author: %s                              ║
+║        License: %s                            ║
+║        GitHub: https://github.com/username/wallet-qr-generator ║
+║                                                          ║
+╚══════════════════════════════════════════════════════════╝
+        """
+
+_STYLES_BOX = """
+╔══════════════════════════════════════════════════════════╗
+║                     Available Styles                     ║
+╠══════════════════════════════════════════════════════════╣
+║                                                          ║
+║  🎨 professional - Complete business-style QR with logo  ║
+║  🎨 minimalist   - Clean, simple QR code only           ║
+║  🎨 dark         - Dark mode with light QR              ║
+║  🎨 gradient     - Color gradient background            ║
+║  🎨 business     - Corporate style with official look   ║
+║  🎨 premium      - Gold-standard premium design         ║
+║  🎨 fast         - Plain QR, fixed mask for batches     ║
+║                                                          ║
+╚══════════════════════════════════════════════════════════╝
+        """
+
+_SUMMARY_BOX = """
+╔══════════════════════════════════════════════════════════╗
+║                    Generation Summary                    ║
+╠══════════════════════════════════════════════════════════╣
+║                                                          ║
+║  📊 Addresses: %-36d ║
+║  🎨 Style: %-39s ║
+║  🎯 Color: %-38s ║
+║  📁 Output: %-37s ║
+║  🖼️  Format: %-38s ║
+║  📐 Size: Level %d/10 (%dpx)              ║
+║                                                          ║
+╚══════════════════════════════════════════════════════════╝
+        """
+
+_INTERACTIVE_MENU = """
+1. 🎨 Generate Single QR Code
+2. 📚 Generate Batch QR Codes
+3. 🎯 Preview Style Templates
+4. ⚙️  Configuration Wizard
+5. 📖 Documentation
+6. 🚪 Exit
+"""
+
+_COMPLETION_REPORT = """
+%s
+🎉 GENERATION COMPLETED SUCCESSFULLY!
+%s
+
+📁 Output Directory: %s
+📄 Generated Files: %d
+⚙️  Config File: %s
+
+🔧 Next Steps:
+   1. Navigate to output directory
+   2. Test QR codes with wallet app
+   3. Share or print as needed
+%s
+✅ All done! Your QR codes are ready to use.
+
+"""
+
+_STYLE_TIPS = {
+    "premium": "   💎 Premium style is best for business cards\n",
+    "minimalist": "   🎯 Minimalist style is best for apps and websites\n",
+}
+
+class _ProgressDisplay:
+    """
+    Redraw a batch ProgressBar from a background thread at a fixed rate
+    
+    The progress callback only queues each finished address; the display
+    thread folds everything that arrived since the last frame into a single
+    ProgressBar.update, so the bar is redrawn at most FRAME_RATE times a
+    second. In verbose mode every queued address is still printed.
+    
+    generate_batch starts its pool workers with forkserver/spawn, so they are
+    never forked from this thread's process while it runs.
+    """
+    
+    FRAME_RATE = 30
+    
+    def __init__(self, progress: Optional[ProgressBar], verbose: bool = False):
+        self.progress = progress
+        self.verbose = verbose
+        self.queue = queue.Queue()
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.done.set()
+        self.thread.join()
+    
+    def update(self, current: int, total: int, address: Optional[str] = None):
+        """generate_batch progress callback"""
+        self.queue.put_nowait(address)
+    
+    def _run(self):
+        """Drain the queue once per frame until the batch is done"""
+        while True:
+            finished = self.done.wait(1 / self.FRAME_RATE)
+            
+            addresses = []
+            try:
+                while True:
+                    addresses.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            if addresses:
+                if self.progress is not None:
+                    self.progress.update(len(addresses))
+                if self.verbose:
+                    # Every finished address still gets its line
+                    for address in addresses:
+                        if address:
+                            print_info(f"  Processing: {address[:40]}...")
+            
+            if finished:
+                return
 
 class WalletQRCLI:
     """Professional CLI interface for Wallet QR Generator"""
     
     def __init__(self):
         self.parser = self._create_parser()
-        self.style_manager = StyleManager()
-        self.terminal_width = get_terminal_width()
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create comprehensive argument parser"""
+    @property
+    def style_manager(self) -> StyleManager:
+        """Process-wide style registry, created on first access"""
+        return get_style_manager()
+    
+    @property
+    def terminal_width(self) -> int:
+        """Terminal width (utils caches it and drops the cache on SIGWINCH)"""
+        return get_terminal_width()
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _create_parser(cls) -> argparse.ArgumentParser:
+        """
+        Create comprehensive argument parser
+        
+        Built once per class and shared: parse_args() does not modify the
+        parser, so every WalletQRCLI instance can reuse it.
+        """
         
         parser = argparse.ArgumentParser(
             prog="walletqr",
             description="""🚀 Professional Crypto Wallet QR Code Generator
 Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=textwrap.dedent("""
-            📚 Examples:
-              %(prog)s "UQDe1kBdULQE3RBtE24jIZYDD7nPov5S-xM-PA3dCzGXHc7X"
-              %(prog)s -a wallets.txt -s professional -c "#27AE60" -o my_qr_codes
-              %(prog)s --batch config.json --style dark --size 8
-              %(prog)s --interactive
-            
-            🎨 Available Styles: professional, minimalist, dark, gradient, business, premium
-            
-            📖 Documentation: https://github.com/username/wallet-qr-generator
-            """)
+            fromfile_prefix_chars='@',
+            epilog=_EPILOG
         )
         
         # Input group
@@ -118,7 +344,7 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         design_group = parser.add_argument_group('🎨 Design Options')
         design_group.add_argument(
             '-s', '--style',
-            choices=['professional', 'minimalist', 'dark', 'gradient', 'business', 'premium'],
+            choices=_STYLE_NAMES,
             default='professional',
             help='QR code style preset (default: professional)'
         )
@@ -186,6 +412,21 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
             help='Border size in modules (default: 4)'
         )
         
+        advanced_group.add_argument(
+            '--mask',
+            type=int,
+            choices=range(0, 8),
+            metavar='0-7',
+            help='Use a fixed mask pattern instead of searching all eight (faster)'
+        )
+        
+        advanced_group.add_argument(
+            '-j', '--jobs',
+            type=int,
+            metavar='N',
+            help='Worker processes for batch generation (default: serial)'
+        )
+        
         advanced_group.add_argument(
             '--no-address',
             action='store_true',
@@ -230,62 +471,53 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         """Print version information"""
         from wallet_qr import __version__, __author__, __license__
         
-        version_info = f"""
-╔══════════════════════════════════════════════════════════╗
-║                                                          ║
-║        Wallet QR Generator v{__version__}                   ║
-║                                                          ║
-║        Author: {__author__}                              ║
-║        License: {__license__}                            ║
-║        GitHub: https://github.com/username/wallet-qr-generator ║
-║                                                          ║
-╚══════════════════════════════════════════════════════════╝
-        """
-        print(version_info)
+        print(_VERSION_BOX % (__version__, __author__, __license__))
     
     def _list_styles(self):
         """List all available styles"""
-        styles_info = """
-╔══════════════════════════════════════════════════════════╗
-║                     Available Styles                     ║
-╠══════════════════════════════════════════════════════════╣
-║                                                          ║
-║  🎨 professional - Complete business-style QR with logo  ║
-║  🎨 minimalist   - Clean, simple QR code only           ║
-║  🎨 dark         - Dark mode with light QR              ║
-║  🎨 gradient     - Color gradient background            ║
-║  🎨 business     - Corporate style with official look   ║
-║  🎨 premium      - Gold-standard premium design         ║
-║                                                          ║
-╚══════════════════════════════════════════════════════════╝
-        """
-        print(styles_info)
+        print(_STYLES_BOX)
         
         # Show color samples
         print("\n🎨 Color Presets:")
-        for scheme in ColorScheme:
-            print(f"  • {scheme.name.lower():12} - {scheme.value[3]}")
+        print(_COLOR_PRESETS)
     
     def _load_addresses(self, filepath: str) -> List[str]:
         """Load addresses from text file"""
+        quiet, verbose = self.args.quiet, self.args.verbose
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                addresses = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            
-            # Validate addresses
-            valid_addresses = []
-            invalid_count = 0
-            
-            for addr in addresses:
-                is_valid, addr_type = validate_wallet_address(addr)
-                if is_valid:
-                    valid_addresses.append(addr)
+            # Validate the whole mapped file in one regex pass (one per CPU,
+            # over line-aligned ranges, for large files); only the matched
+            # addresses are ever decoded
+            with open(filepath, 'rb') as f, _map_readonly(f) as data:
+                workers = os.cpu_count() or 1
+                # Workers reopen the file by path, so only mapped regular files
+                # can be split between them
+                if (len(data) < _PARALLEL_SCAN_BYTES or workers < 2
+                        or not isinstance(data, mmap.mmap)):
+                    valid_addresses = [addr for addr, addr_type in find_wallet_addresses(data)]
+                    entry_count = len(_ENTRY_LINE.findall(data))
                 else:
-                    invalid_count += 1
-                    if self.args.verbose:
-                        print_warning(f"Invalid address skipped: {addr[:50]}...")
+                    from concurrent.futures import ProcessPoolExecutor
+                    from .generator import _POOL_CONTEXT
+                    
+                    valid_addresses, entry_count = [], 0
+                    jobs = [(filepath, start, end) for start, end in _split_ranges(data, workers)]
+                    with ProcessPoolExecutor(max_workers=len(jobs), mp_context=_POOL_CONTEXT) as executor:
+                        for valid, count in executor.map(_scan_range, jobs):
+                            valid_addresses.extend(valid)
+                            entry_count += count
+                
+                invalid_count = entry_count - len(valid_addresses)
+                
+                if invalid_count > 0 and verbose:
+                    valid = {addr.encode() for addr in valid_addresses}
+                    for entry in _ENTRY_LINE.findall(data):
+                        if entry not in valid:
+                            addr = entry.decode('utf-8', 'replace')
+                            print_warning(f"Invalid address skipped: {addr[:50]}...")
             
-            if invalid_count > 0 and not self.args.quiet:
+            if invalid_count > 0 and not quiet:
                 print_warning(f"Skipped {invalid_count} invalid addresses")
             
             return valid_addresses
@@ -300,8 +532,10 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
     def _load_batch_config(self, filepath: str) -> Dict[str, Any]:
         """Load batch configuration from JSON"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # One binary read; orjson (if installed) parses it without
+            # building intermediate str objects
+            with open(filepath, 'rb') as f:
+                config = loads_json(f.read())
             
             return config
             
@@ -331,14 +565,11 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         config.logo_path = self.args.logo
         config.logo_size = self.args.logo_size
         config.watermark = self.args.watermark
+        if self.args.mask is not None:
+            config.mask = self.args.mask
         
-        # Size mapping
-        size_map = {
-            1: (2, 8), 2: (3, 10), 3: (4, 12), 4: (5, 14),
-            5: (6, 16), 6: (7, 18), 7: (8, 20), 8: (9, 22),
-            9: (10, 24), 10: (12, 26)
-        }
-        config.version, config.box_size = size_map.get(self.args.size, (6, 16))
+        # Size mapping (argparse restricts --size to 1-10)
+        config.version, config.box_size = _SIZE_MAP[self.args.size - 1]
         
         # Custom titles
         if self.args.title:
@@ -357,27 +588,21 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         if self.args.quiet:
             return
         
-        summary = f"""
-╔══════════════════════════════════════════════════════════╗
-║                    Generation Summary                    ║
-╠══════════════════════════════════════════════════════════╣
-║                                                          ║
-║  📊 Addresses: {len(addresses):<36} ║
-║  🎨 Style: {self.args.style:<39} ║
-║  🎯 Color: {config.fill_color:<38} ║
-║  📁 Output: {output_dir:<37} ║
-║  🖼️  Format: {self.args.format.upper():<38} ║
-║  📐 Size: Level {self.args.size}/10 ({config.box_size}px)              ║
-║                                                          ║
-╚══════════════════════════════════════════════════════════╝
-        """
-        
-        print(summary)
+        print(_SUMMARY_BOX % (
+            len(addresses), self.args.style, config.fill_color, output_dir,
+            self.args.format.upper(), self.args.size, config.box_size
+        ))
         
         if self.args.verbose:
             print_info(f"QR Version: {config.version}")
             print_info(f"Error Correction: {config.error_correction}")
             print_info(f"Border: {config.border} modules")
+            if config.mask is not None:
+                print_info(f"Mask Pattern: {config.mask}")
+            if len(addresses) > 1:
+                # Same rule generate_batch applies, so this matches what runs
+                workers = batch_worker_count(len(addresses), self.args.jobs)
+                print_info(f"Workers: {workers if workers > 1 else 'serial'}")
             if config.add_logo:
                 print_info(f"Logo: {config.logo_path}")
     
@@ -391,12 +616,8 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         print("=" * self.terminal_width)
         
         while True:
-            print("\n1. 🎨 Generate Single QR Code")
-            print("2. 📚 Generate Batch QR Codes")
-            print("3. 🎯 Preview Style Templates")
-            print("4. ⚙️  Configuration Wizard")
-            print("5. 📖 Documentation")
-            print("6. 🚪 Exit")
+            sys.stdout.write(_INTERACTIVE_MENU)
+            sys.stdout.flush()
             
             choice = input("\nSelect option (1-6): ").strip()
             
@@ -432,7 +653,7 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         
         # Style selection
         print("\n🎨 Select Style:")
-        styles = ["professional", "minimalist", "dark", "gradient", "business", "premium"]
+        styles = _STYLE_NAMES
         for i, style in enumerate(styles, 1):
             print(f"  {i}. {style}")
         
@@ -448,8 +669,7 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         
         # Color selection
         print("\n🎯 Select Color (or enter custom hex):")
-        for scheme in ColorScheme:
-            print(f"  • {scheme.name.lower():10} - {scheme.value[3]}")
+        print(_COLOR_CHOICES)
         
         color = input("\nEnter color name or hex code (default: #2E86C1): ").strip()
         if not color:
@@ -457,9 +677,15 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         
         # Create config
         config = QRConfig.from_preset(style)
-        config.fill_color = color if color.startswith("#") else f"#{color}"
+        scheme = ColorScheme.get(color)
+        if scheme:
+            config.fill_color = scheme.hex_color
+        else:
+            config.fill_color = color if color.startswith("#") else f"#{color}"
         
         # Generate
+        from .generator import QRGenerator
+        
         output_dir = create_output_dir("output", "interactive")
         generator = QRGenerator(config)
         
@@ -503,7 +729,7 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         print("\nAvailable styles with sample configurations:")
         print("-" * 60)
         
-        for style in ["professional", "minimalist", "dark", "gradient", "business", "premium"]:
+        for style in _STYLE_NAMES:
             config = QRConfig.from_preset(style)
             print(f"\n🎨 {style.upper():12}")
             print(f"   Title: {config.title}")
@@ -520,6 +746,7 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
         try:
             # Parse arguments
             self.args = self.parser.parse_args(args)
+            quiet, verbose = self.args.quiet, self.args.verbose
             
             # Handle special flags
             if self.args.version:
@@ -536,14 +763,14 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
             
             # Check if we have any input
             if not any([self.args.address, self.args.address_file, self.args.batch]):
-                if not self.args.quiet:
+                if not quiet:
                     print_banner()
                 print_error("Error: No input specified. Use --help for usage information.")
                 print_info("Tip: Use --interactive for guided mode.")
                 sys.exit(1)
             
             # Print banner if not quiet
-            if not self.args.quiet and not self.args.verbose:
+            if not quiet and not verbose:
                 print_banner()
             
             # Load addresses
@@ -560,11 +787,14 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
                 addresses = self._load_addresses(self.args.address_file)
                 
             else:
-                # Single address
-                is_valid, addr_type = validate_wallet_address(self.args.address)
+                # Single address; obvious typos are rejected before any regex runs
+                if _quick_reject(self.args.address):
+                    is_valid, addr_type = False, "invalid"
+                else:
+                    is_valid, addr_type = validate_wallet_address(self.args.address)
                 if is_valid:
                     addresses = [self.args.address]
-                    if self.args.verbose:
+                    if verbose:
                         print_info(f"Detected {addr_type} address format")
                 else:
                     print_error(f"Invalid wallet address: {self.args.address}")
@@ -581,12 +811,14 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
             output_dir = create_output_dir(self.args.output, "qr_codes")
             
             # Print summary
-            if not self.args.quiet:
+            if not quiet:
                 self._print_summary(addresses, qr_config, output_dir)
                 print("\n" + "=" * self.terminal_width)
                 print("🚀 Starting QR Code Generation...")
             
-            # Create generator
+            # Create generator (imported here so --help/--version stay light)
+            from .generator import QRGenerator
+            
             generator = QRGenerator(qr_config)
             
             # Generate QR codes
@@ -595,14 +827,12 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
                 filename = f"{self.args.prefix}_{qr_config.fill_color.replace('#', '')}.png"
                 output_path = os.path.join(output_dir, filename)
                 
-                if not self.args.quiet:
-                    progress = ProgressBar(1, prefix='Progress:', suffix='Complete', length=40)
-                
+                # No progress bar for a single step; the "Starting" line and
+                # the success message already bracket the work
                 try:
-                    result = generator.generate(addresses[0], output_path, show_info=self.args.verbose)
+                    result = generator.generate(addresses[0], output_path, show_info=verbose)
                     
-                    if not self.args.quiet:
-                        progress.update(1)
+                    if not quiet:
                         print_success(f"\n✅ QR code generated successfully!")
                         print_info(f"   File: {output_path}")
                         print_info(f"   Size: {result['size_formatted']}")
@@ -614,28 +844,25 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
                     
             else:
                 # Batch generation
-                if not self.args.quiet:
+                progress = None
+                if not quiet:
                     progress = ProgressBar(len(addresses), prefix='Generating:', suffix='Complete', length=40)
                 
-                def update_progress(current, total, address=None):
-                    if not self.args.quiet:
-                        progress.update()
-                    if self.args.verbose and address:
-                        print_info(f"  Processing: {address[:40]}...")
-                
                 try:
-                    results = generator.generate_batch(
-                        addresses, 
-                        output_dir,
-                        progress_callback=update_progress
-                    )
+                    with _ProgressDisplay(progress, verbose) as display:
+                        results = generator.generate_batch(
+                            addresses, 
+                            output_dir,
+                            progress_callback=display.update,
+                            max_workers=self.args.jobs
+                        )
                     
-                    if not self.args.quiet:
+                    if not quiet:
                         print_success(f"\n✅ Batch generation complete!")
                         print_info(f"   Generated: {len(results)} QR codes")
                         print_info(f"   Directory: {output_dir}")
                         
-                        if self.args.verbose:
+                        if verbose:
                             total_size = sum(r['size_bytes'] for r in results)
                             avg_size = total_size / len(results) if results else 0
                             print_info(f"   Total size: {format_file_size(total_size)}")
@@ -660,26 +887,13 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
             config_file = save_config(config_data, output_dir)
             
             # Final message
-            if not self.args.quiet:
-                print("\n" + "=" * self.terminal_width)
-                print("🎉 GENERATION COMPLETED SUCCESSFULLY!")
-                print("=" * self.terminal_width)
-                
-                print(f"\n📁 Output Directory: {output_dir}")
-                print(f"📄 Generated Files: {len(addresses)}")
-                print(f"⚙️  Config File: {config_file}")
-                
-                print("\n🔧 Next Steps:")
-                print("   1. Navigate to output directory")
-                print("   2. Test QR codes with wallet app")
-                print("   3. Share or print as needed")
-                
-                if self.args.style == "premium":
-                    print("   💎 Premium style is best for business cards")
-                elif self.args.style == "minimalist":
-                    print("   🎯 Minimalist style is best for apps and websites")
-                
-                print("\n✅ All done! Your QR codes are ready to use.\n")
+            if not quiet:
+                rule = "=" * self.terminal_width
+                sys.stdout.write(_COMPLETION_REPORT % (
+                    rule, rule, output_dir, len(addresses), config_file,
+                    _STYLE_TIPS.get(self.args.style, "")
+                ))
+                sys.stdout.flush()
             
             return 0
             
@@ -694,6 +908,8 @@ Create beautiful, production-ready QR codes for cryptocurrency wallets.""",
 
 def main():
     """Entry point for CLI"""
+    # The application owns the process, so it may install a SIGWINCH handler
+    watch_terminal_resizes()
     cli = WalletQRCLI()
     return cli.run()
 
@@ -3,112 +3,88 @@ Main QR code generation engine
 """
 
 import qrcode
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageFilter
+import io
+import multiprocessing
 import os
 import random
-from typing import Optional, Tuple, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, List, Dict, Any, Iterator
 from pathlib import Path
+from functools import lru_cache
 import numpy as np
 
 from .styles import QRConfig, Layout, ColorScheme
-from .utils import ProgressBar, generate_filename, format_file_size
-from .exceptions import GenerationError
+from .utils import ProgressBar, generate_filename, format_file_size, batch_worker_count
+from .exceptions import ConfigError, GenerationError
+from .png_fast import encode_monochrome_png
+
+# Error correction level name -> qrcode constant
+_EC_MAP = {
+    "L": qrcode.constants.ERROR_CORRECT_L,
+    "M": qrcode.constants.ERROR_CORRECT_M,
+    "Q": qrcode.constants.ERROR_CORRECT_Q,
+    "H": qrcode.constants.ERROR_CORRECT_H
+}
+
+# Batch workers are never forked: the caller may have threads running (the
+# CLI's progress display does), and forking a threaded process can deadlock
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 
 class QRGenerator:
     """Professional QR code generator with advanced features"""
     
+    # Shared by all instances; gradient name -> module colors, cycled diagonally
+    GRADIENTS = {
+        "sunset": [(255, 107, 107), (255, 167, 38), (255, 193, 7)],
+        "ocean": [(41, 128, 185), (52, 152, 219), (93, 173, 226)],
+        "forest": [(39, 174, 96), (46, 204, 113), (88, 214, 141)],
+        "royal": [(142, 68, 173), (155, 89, 182), (165, 105, 189)],
+        "fire": [(231, 76, 60), (235, 152, 78), (241, 196, 15)]
+    }
+    
     def __init__(self, config: Optional[QRConfig] = None):
         self.config = config or QRConfig()
-        self.font_cache = {}
-        self.gradients = {
-            "sunset": [(255, 107, 107), (255, 167, 38), (255, 193, 7)],
-            "ocean": [(41, 128, 185), (52, 152, 219), (93, 173, 226)],
-            "forest": [(39, 174, 96), (46, 204, 113), (88, 214, 141)],
-            "royal": [(142, 68, 173), (155, 89, 182), (165, 105, 189)],
-            "fire": [(231, 76, 60), (235, 152, 78), (241, 196, 15)]
-        }
     
     def _load_font(self, size: int, bold: bool = False, italic: bool = False) -> Optional[ImageFont.FreeTypeFont]:
-        """Load font with comprehensive fallbacks"""
-        cache_key = f"{size}_{bold}_{italic}"
-        
-        if cache_key in self.font_cache:
-            return self.font_cache[cache_key]
-        
-        # Try different font paths
-        font_paths = []
-        
-        if bold and italic:
-            font_paths.extend([
-                "arialbi.ttf", "Arial Bold Italic.ttf",
-                "/System/Library/Fonts/Arial Bold Italic.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-BoldItalic.ttf"
-            ])
-        elif bold:
-            font_paths.extend([
-                "arialbd.ttf", "Arial Bold.ttf",
-                "/System/Library/Fonts/Arial Bold.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"
-            ])
-        elif italic:
-            font_paths.extend([
-                "ariali.ttf", "Arial Italic.ttf",
-                "/System/Library/Fonts/Arial Italic.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf"
-            ])
-        else:
-            font_paths.extend([
-                "arial.ttf", "Arial.ttf",
-                "/System/Library/Fonts/Arial.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
-            ])
-        
-        # Also try system fonts
-        system_fonts = [
-            "DejaVuSans.ttf", "LiberationSans-Regular.ttf",
-            "Ubuntu-R.ttf", "Roboto-Regular.ttf"
-        ]
-        
-        font_paths.extend(system_fonts)
+        """Load font with comprehensive fallbacks (cached process-wide)"""
+        return _load_font(size, bold, italic)
+    
+    def _make_qr(self, data: str) -> qrcode.QRCode:
+        """Encode data into a fitted QRCode using the configured error correction"""
+        qr = qrcode.QRCode(
+            version=self.config.version,
+            error_correction=_EC_MAP.get(self.config.error_correction.upper(), 
+                                        qrcode.constants.ERROR_CORRECT_H),
+            box_size=self.config.box_size,
+            border=self.config.border,
+            mask_pattern=self.config.mask,
+        )
         
-        for font_path in font_paths:
-            try:
-                if os.path.exists(font_path):
-                    font = ImageFont.truetype(font_path, size)
-                    self.font_cache[cache_key] = font
-                    return font
-            except:
-                continue
+        qr.add_data(data)
+        qr.make(fit=True)
         
-        # Final fallback
-        font = ImageFont.load_default()
-        self.font_cache[cache_key] = font
-        return font
+        return qr
     
     def _create_base_qr(self, data: str) -> Image.Image:
         """Create base QR code image with error correction"""
         try:
-            # Map error correction string to constant
-            ec_map = {
-                "L": qrcode.constants.ERROR_CORRECT_L,
-                "M": qrcode.constants.ERROR_CORRECT_M,
-                "Q": qrcode.constants.ERROR_CORRECT_Q,
-                "H": qrcode.constants.ERROR_CORRECT_H
-            }
+            qr = self._make_qr(data)
             
-            qr = qrcode.QRCode(
-                version=self.config.version,
-                error_correction=ec_map.get(self.config.error_correction, 
-                                           qrcode.constants.ERROR_CORRECT_H),
-                box_size=self.config.box_size,
-                border=self.config.border,
-            )
+            # Color one RGB pixel per module and scale it up in a single
+            # resize, rather than having qrcode draw each dark module as a
+            # rectangle and converting its image to RGB afterwards
+            matrix = qr.get_matrix()
+            side = len(matrix) * self.config.box_size
             
-            qr.add_data(data)
-            qr.make(fit=True)
+            dark = np.array(matrix, dtype=bool)
+            fill = np.array(ImageColor.getcolor(self.config.fill_color, "RGB"), dtype=np.uint8)
+            back = np.array(ImageColor.getcolor(self.config.back_color, "RGB"), dtype=np.uint8)
+            pixels = np.where(dark[..., None], fill, back)
             
-            return qr.make_image(fill_color=self.config.fill_color, 
-                               back_color=self.config.back_color).convert("RGB")
+            return Image.fromarray(pixels, "RGB").resize((side, side), Image.NEAREST)
             
         except Exception as e:
             raise GenerationError(f"Failed to create base QR code: {e}")
@@ -121,42 +97,39 @@ class QRGenerator:
                 error_correction=qrcode.constants.ERROR_CORRECT_H,
                 box_size=self.config.box_size,
                 border=self.config.border,
+                mask_pattern=self.config.mask,
             )
             
             qr.add_data(data)
             qr.make(fit=True)
             
-            # Get QR matrix
+            # Get QR matrix (already includes the quiet-zone modules)
             matrix = qr.get_matrix()
-            
-            # Create blank image
-            size = len(matrix) * self.config.box_size + 2 * self.config.border * self.config.box_size
-            img = Image.new("RGB", (size, size), self.config.back_color)
-            draw = ImageDraw.Draw(img)
+            modules = len(matrix)
+            box_size = self.config.box_size
             
             # Choose gradient
             gradient_name = self.config.custom_css.get("gradient_name", "sunset")
-            gradient_colors = self.gradients.get(gradient_name, self.gradients["sunset"])
-            
-            # Draw QR with gradient
-            for y in range(len(matrix)):
-                for x in range(len(matrix)):
-                    if matrix[y][x]:
-                        # Calculate gradient color based on position
-                        color_idx = (x + y) % len(gradient_colors)
-                        color = gradient_colors[color_idx]
-                        
-                        # Draw box
-                        x_pos = self.config.border * self.config.box_size + x * self.config.box_size
-                        y_pos = self.config.border * self.config.box_size + y * self.config.box_size
-                        
-                        draw.rectangle(
-                            [x_pos, y_pos, 
-                             x_pos + self.config.box_size, 
-                             y_pos + self_config.box_size],
-                            fill=color,
-                            outline=color
-                        )
+            gradient_colors = self.GRADIENTS.get(gradient_name, self.GRADIENTS["sunset"])
+            
+            # Build one RGB pixel per module, colored by diagonal position:
+            # index the gradient palette by (x + y) and mask in the background
+            palette = np.array(gradient_colors, dtype=np.uint8)
+            light = np.array(ImageColor.getcolor(self.config.back_color, "RGB"), dtype=np.uint8)
+            positions = np.arange(modules)
+            diagonal = np.add.outer(positions, positions) % len(palette)
+            dark = np.array(matrix, dtype=bool)
+            pixels = np.where(dark[..., None], palette[diagonal], light)
+            
+            # Blit the module grid and scale it up in a single resize
+            module_img = Image.fromarray(pixels, "RGB")
+            qr_img = module_img.resize((modules * box_size, modules * box_size), Image.NEAREST)
+            
+            # Keep the extra outer margin around the matrix
+            offset = self.config.border * box_size
+            size = modules * box_size + 2 * offset
+            img = Image.new("RGB", (size, size), self.config.back_color)
+            img.paste(qr_img, (offset, offset))
             
             return img
             
@@ -169,35 +142,19 @@ class QRGenerator:
             return qr_img
         
         try:
-            if not os.path.exists(self.config.logo_path):
-                print(f"Warning: Logo file not found: {self.config.logo_path}")
-                return qr_img
-            
-            logo = Image.open(self.config.logo_path).convert("RGBA")
-            
-            # Resize logo
-            logo_size = self.config.logo_size
-            logo = logo.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
-            
-            # Create circular mask for logo with shadow
-            mask_size = logo_size + 4
-            mask = Image.new("L", (mask_size, mask_size), 0)
-            draw = ImageDraw.Draw(mask)
-            
-            # Draw shadow (slightly larger circle)
-            draw.ellipse((2, 2, mask_size-2, mask_size-2), fill=100)
-            
-            # Draw main circle
-            draw.ellipse((0, 0, logo_size, logo_size), fill=255)
-            
-            # Create logo with white background
-            logo_bg = Image.new("RGBA", (mask_size, mask_size), (255, 255, 255, 0))
-            logo_pos = ((mask_size - logo_size) // 2, (mask_size - logo_size) // 2)
-            logo_bg.paste(logo, logo_pos, logo)
+            # The prepared logo is cached per file version, so a batch decodes
+            # and resamples it once while an edited file is still picked up
+            mtime_ns = os.stat(self.config.logo_path).st_mtime_ns
+        except OSError:
+            print(f"Warning: Logo file not found: {self.config.logo_path}")
+            return qr_img
+        
+        try:
+            logo_bg, mask = _prepare_logo(self.config.logo_path, mtime_ns, self.config.logo_size)
             
             # Paste logo on QR code
             qr_size = qr_img.size[0]
-            pos = ((qr_size - mask_size) // 2, (qr_size - mask_size) // 2)
+            pos = ((qr_size - mask.width) // 2, (qr_size - mask.height) // 2)
             
             # Create composite
             qr_img.paste(logo_bg, pos, mask)
@@ -213,21 +170,16 @@ class QRGenerator:
         width, height = size
         
         if style == "gradient":
-            # Create vertical gradient
-            base = Image.new('RGB', (width, height), (255, 255, 255))
-            
-            for y in range(height):
-                # Gradient from light to slightly darker
-                r = int(248 - (y / height) * 20)
-                g = int(249 - (y / height) * 30)
-                b = int(249 - (y / height) * 40)
-                
-                for x in range(width):
-                    # Add slight horizontal variation
-                    variation = int((x / width) * 10)
-                    base.putpixel((x, y), (min(255, r + variation), 
-                                          min(255, g + variation), 
-                                          min(255, b + variation)))
+            # Vertical gradient from light to slightly darker, one row of
+            # (r, g, b) start values per y
+            fraction = np.arange(height)[:, None] / height
+            start = (np.array([248, 249, 249]) - fraction * np.array([20, 30, 40])).astype(np.int64)
+            
+            # Add slight horizontal variation, one value per x
+            variation = (np.arange(width) / width * 10).astype(np.int64)
+            
+            pixels = np.minimum(255, start[:, None, :] + variation[None, :, None])
+            base = Image.fromarray(pixels.astype(np.uint8), 'RGB')
             
             # Apply subtle blur
             base = base.filter(ImageFilter.GaussianBlur(radius=0.5))
@@ -254,46 +206,33 @@ class QRGenerator:
         if not text:
             return img
         
-        draw = ImageDraw.Draw(img)
         font = self._load_font(20, italic=True)
         
         if font:
-            # Semi-transparent watermark
-            watermark = Image.new('RGBA', img.size, (255, 255, 255, 0))
-            watermark_draw = ImageDraw.Draw(watermark)
-            
-            # Calculate text size and position (diagonal)
-            text_width = draw.textlength(text, font=font)
-            text_height = 30
-            
-            # Draw at 45 degree angle
+            # Draw every stamp into one row-high coverage mask at 30/255 opacity
+            # (overlapping stamps combine there exactly as on the old RGBA
+            # layer), then blend the gray through it in a single paste, with
+            # no RGBA copy of the whole card to composite and convert back
+            right, bottom = font.getbbox(text)[2:]
+            row_mask = Image.new('L', (img.width, max(bottom, 1)), 0)
+            mask_draw = ImageDraw.Draw(row_mask)
             for i in range(-img.height, img.width + img.height, 150):
-                watermark_draw.text(
-                    (i, img.height // 2),
-                    text,
-                    font=font,
-                    fill=(200, 200, 200, 30)
-                )
+                if i >= img.width:
+                    break
+                if i + right <= 0:
+                    continue
+                mask_draw.text((i, 0), text, font=font, fill=30)
             
-            # Composite with original
-            img = Image.alpha_composite(img.convert('RGBA'), watermark)
+            img.paste((200, 200, 200), (0, img.height // 2), row_mask)
         
-        return img.convert('RGB')
+        return img
     
     def _add_emboss_effect(self, img: Image.Image) -> Image.Image:
         """Add emboss effect to QR border"""
         if not self.config.show_qr_border:
             return img
         
-        draw = ImageDraw.Draw(img)
-        
-        # Create embossed border effect
-        border_color = self.config.fill_color
-        r, g, b = [int(border_color[i:i+2], 16) for i in (1, 3, 5)]
-        
-        # Light and dark versions for emboss
-        light_color = (min(255, r + 40), min(255, g + 40), min(255, b + 40))
-        dark_color = (max(0, r - 40), max(0, g - 40), max(0, b - 40))
+        light_color, dark_color = _emboss_colors(self.config.fill_color)
         
         # Draw embossed rectangle
         rect = [
@@ -302,174 +241,432 @@ class QRGenerator:
             img.width - self.config.border * self.config.box_size + 15,
             img.height - self.config.border * self.config.box_size + 15
         ]
+        x0, y0, x1, y1 = rect
+        
+        # Solid 2px fills covering exactly the pixels of width=2 lines,
+        # skipping ImageDraw's line rasterizer
         
         # Light top/left
-        draw.line([rect[0], rect[1], rect[2], rect[1]], fill=light_color, width=2)
-        draw.line([rect[0], rect[1], rect[0], rect[3]], fill=light_color, width=2)
+        img.paste(light_color, (x0, y0, x1 + 1, y0 + 2))
+        img.paste(light_color, (x0, y0, x0 + 2, y1 + 1))
         
         # Dark bottom/right
-        draw.line([rect[0], rect[3], rect[2], rect[3]], fill=dark_color, width=2)
-        draw.line([rect[2], rect[1], rect[2], rect[3]], fill=dark_color, width=2)
+        img.paste(dark_color, (x0, y1, x1 + 1, y1 + 2))
+        img.paste(dark_color, (x1, y0, x1 + 2, y1 + 1))
         
         return img
     
+    def _encode_fast(self, data: str) -> Tuple[bytes, Tuple[int, int]]:
+        """Encode a plain QR code straight from the module matrix (backend="fast")"""
+        matrix = self._make_qr(data).get_matrix()
+        side = len(matrix) * self.config.box_size
+        
+        png = encode_monochrome_png(
+            matrix,
+            scale=self.config.box_size,
+            dark=ImageColor.getcolor(self.config.fill_color, "RGB"),
+            light=ImageColor.getcolor(self.config.back_color, "RGB"),
+            compress_level=self.config.png_compress_level
+        )
+        
+        return png, (side, side)
+    
+    def _style_name(self) -> str:
+        """Style label reported in generation results"""
+        if self.config.backend == "fast":
+            return "fast"
+        return "gradient" if "gradient" in self.config.custom_css else "standard"
+    
+    def _render(self, data: str) -> Image.Image:
+        """Render the full styled QR card (backend="pil")"""
+        # Create appropriate QR code
+        if "gradient" in self.config.custom_css:
+            qr_img = self._create_gradient_qr(data)
+        else:
+            qr_img = self._create_base_qr(data)
+        
+        # Add logo if configured
+        if self.config.add_logo:
+            qr_img = self._add_logo(qr_img)
+        
+        # Create layout
+        layout = Layout.auto(qr_img.size, self.config)
+        
+        # Create final image with background
+        if "gradient" in self.config.custom_css:
+            final_img = self._create_background((layout.width, layout.height), "gradient")
+        else:
+            final_img = self._create_background((layout.width, layout.height), "solid")
+        
+        draw = ImageDraw.Draw(final_img)
+        
+        # Add emboss effect to QR area
+        if self.config.show_qr_border:
+            final_img = self._add_emboss_effect(final_img)
+        
+        # Paste QR code
+        final_img.paste(qr_img, layout.qr_position)
+        
+        # Add title
+        if self.config.title:
+            title_font = self._load_font(28, bold=True)
+            if title_font:
+                title_width = draw.textlength(self.config.title, font=title_font)
+                title_x = (layout.width - title_width) // 2
+                draw.text((title_x, layout.title_position[1]), 
+                         self.config.title, 
+                         fill=self.config.fill_color, 
+                         font=title_font, 
+                         stroke_width=1,
+                         stroke_fill=self.config.back_color)
+        
+        # Add subtitle
+        if self.config.subtitle:
+            subtitle_font = self._load_font(16, italic=True)
+            if subtitle_font:
+                subtitle_width = draw.textlength(self.config.subtitle, font=subtitle_font)
+                subtitle_x = (layout.width - subtitle_width) // 2
+                draw.text((subtitle_x, layout.subtitle_position[1]), 
+                         self.config.subtitle, 
+                         fill="#7F8C8D", 
+                         font=subtitle_font)
+        
+        # Add wallet address
+        if self.config.show_address:
+            # Label
+            label_font = self._load_font(16, bold=True)
+            if label_font:
+                draw.text(layout.address_position, 
+                         "Wallet Address:", 
+                         fill="#2C3E50", 
+                         font=label_font)
+            
+            # Address (shortened for display)
+            if len(data) > 30:
+                display_addr = f"{data[:15]}...{data[-15:]}"
+            else:
+                display_addr = data
+            
+            addr_font = self._load_font(14)
+            if addr_font:
+                addr_y = layout.address_position[1] + 25
+                draw.text((layout.padding, addr_y), 
+                         display_addr, 
+                         fill=self.config.fill_color, 
+                         font=addr_font)
+            
+            # Full address in small monospace font
+            small_font = self._load_font(10)
+            if small_font:
+                full_addr_y = addr_y + 30
+                
+                # Split long address into 50-character lines, 15px apart,
+                # drawn in one call (spacing is the gap below each line)
+                lines = "\n".join(data[i:i+50] for i in range(0, len(data), 50))
+                draw.multiline_text((layout.padding, full_addr_y), 
+                                    lines, 
+                                    fill="#7F8C8D", 
+                                    font=small_font, 
+                                    spacing=15 - small_font.getbbox("A")[3])
+        
+        # Add watermark
+        if self.config.watermark:
+            final_img = self._add_watermark(final_img, self.config.watermark)
+        
+        return final_img
+    
+    def _encode(self, data: str) -> Tuple[bytes, Tuple[int, int]]:
+        """Render data to PNG bytes, returning (png_bytes, dimensions)"""
+        if self.config.backend == "fast":
+            return self._encode_fast(data)
+        
+        final_img = self._render(data)
+        buffer = io.BytesIO()
+        final_img.save(buffer, format="PNG", optimize=self.config.png_optimize,
+                       compress_level=self.config.png_compress_level)
+        return buffer.getvalue(), final_img.size
+    
+    def _write(self, data: str, output_path: str) -> Dict[str, Any]:
+        """Render data into output_path and describe the result (no validation)"""
+        if self.config.backend == "fast":
+            png, dimensions = self._encode_fast(data)
+            with open(output_path, "wb") as f:
+                f.write(png)
+            file_size = len(png)
+        else:
+            final_img = self._render(data)
+            dimensions = final_img.size
+            
+            # Resolve the format from the extension before creating the file,
+            # so an unknown extension leaves nothing behind
+            ext = os.path.splitext(output_path)[1].lower()
+            image_format = Image.registered_extensions().get(ext)
+            if image_format is None:
+                raise ValueError(f"unknown file extension: {ext}")
+            
+            # Save image with high quality; the large buffer coalesces the
+            # encoder's many small chunk writes into a few syscalls
+            f = open(output_path, "wb", buffering=self.config.io_buffer_size)
+            try:
+                with f:
+                    final_img.save(f, format=image_format, quality=95,
+                                   optimize=self.config.png_optimize,
+                                   compress_level=self.config.png_compress_level)
+                    # Bytes written so far, no need to stat the file afterwards
+                    file_size = f.tell()
+            except Exception:
+                # Drop the partial file, as Image.save(path) does
+                os.unlink(output_path)
+                raise
+        
+        return {
+            "filepath": output_path,
+            "size_bytes": file_size,
+            "size_formatted": format_file_size(file_size),
+            "dimensions": dimensions,
+            "address": data,
+            "style": self._style_name()
+        }
+    
     def generate(self, data: str, output_path: str, show_info: bool = False) -> Dict[str, Any]:
         """
         Generate QR code with all enhancements
         
+        With config.backend == "fast" only the bare QR code is written (as PNG,
+        whatever the file extension); titles, logo and other styling are skipped.
+        
         Returns:
             Dictionary with generation details
         """
         try:
+            self.config.validate()
+            
             if show_info:
                 print(f"Generating QR code for: {data[:30]}...")
             
-            # Create appropriate QR code
-            if "gradient" in self.config.custom_css:
-                qr_img = self._create_gradient_qr(data)
-            else:
-                qr_img = self._create_base_qr(data)
-            
-            # Add logo if configured
-            if self.config.add_logo:
-                qr_img = self._add_logo(qr_img)
+            return self._write(data, output_path)
             
-            # Create layout
-            layout = Layout.auto(qr_img.size, self.config)
-            
-            # Create final image with background
-            if "gradient" in self.config.custom_css:
-                final_img = self._create_background((layout.width, layout.height), "gradient")
-            else:
-                final_img = self._create_background((layout.width, layout.height), "solid")
-            
-            draw = ImageDraw.Draw(final_img)
-            
-            # Add emboss effect to QR area
-            if self.config.show_qr_border:
-                final_img = self._add_emboss_effect(final_img)
-            
-            # Paste QR code
-            final_img.paste(qr_img, layout.qr_position)
-            
-            # Add title
-            if self.config.title:
-                title_font = self._load_font(28, bold=True)
-                if title_font:
-                    title_width = draw.textlength(self.config.title, font=title_font)
-                    title_x = (layout.width - title_width) // 2
-                    draw.text((title_x, layout.title_position[1]), 
-                             self.config.title, 
-                             fill=self.config.fill_color, 
-                             font=title_font, 
-                             stroke_width=1,
-                             stroke_fill=self.config.back_color)
-            
-            # Add subtitle
-            if self.config.subtitle:
-                subtitle_font = self._load_font(16, italic=True)
-                if subtitle_font:
-                    subtitle_width = draw.textlength(self.config.subtitle, font=subtitle_font)
-                    subtitle_x = (layout.width - subtitle_width) // 2
-                    draw.text((subtitle_x, layout.subtitle_position[1]), 
-                             self.config.subtitle, 
-                             fill="#7F8C8D", 
-                             font=subtitle_font)
-            
-            # Add wallet address
-            if self.config.show_address:
-                # Label
-                label_font = self._load_font(16, bold=True)
-                if label_font:
-                    draw.text(layout.address_position, 
-                             "Wallet Address:", 
-                             fill="#2C3E50", 
-                             font=label_font)
-                
-                # Address (shortened for display)
-                if len(data) > 30:
-                    display_addr = f"{data[:15]}...{data[-15:]}"
-                else:
-                    display_addr = data
-                
-                addr_font = self._load_font(14)
-                if addr_font:
-                    addr_y = layout.address_position[1] + 25
-                    draw.text((layout.padding, addr_y), 
-                             display_addr, 
-                             fill=self.config.fill_color, 
-                             font=addr_font)
-                
-                # Full address in small monospace font
-                small_font = self._load_font(10)
-                if small_font:
-                    full_addr_y = addr_y + 30
-                    
-                    # Split long address into multiple lines
-                    if len(data) > 50:
-                        chunks = [data[i:i+50] for i in range(0, len(data), 50)]
-                        for i, chunk in enumerate(chunks):
-                            draw.text((layout.padding, full_addr_y + i * 15), 
-                                     chunk, 
-                                     fill="#7F8C8D", 
-                                     font=small_font)
-                    else:
-                        draw.text((layout.padding, full_addr_y), 
-                                 data, 
-                                 fill="#7F8C8D", 
-                                 font=small_font)
-            
-            # Add watermark
-            if self.config.watermark:
-                final_img = self._add_watermark(final_img, self.config.watermark)
-            
-            # Save image with high quality
-            final_img.save(output_path, quality=95, optimize=True)
-            
-            # Return generation info
-            file_size = os.path.getsize(output_path)
-            
-            return {
-                "filepath": output_path,
-                "size_bytes": file_size,
-                "size_formatted": format_file_size(file_size),
-                "dimensions": final_img.size,
-                "address": data,
-                "style": "gradient" if "gradient" in self.config.custom_css else "standard"
-            }
+        except Exception as e:
+            raise GenerationError(f"Failed to generate QR code: {e}")
+    
+    def generate_bytes(self, data: str) -> bytes:
+        """
+        Generate QR code as PNG bytes without touching the filesystem
+        
+        Returns:
+            Encoded PNG image
+        """
+        try:
+            self.config.validate()
+            return self._encode(data)[0]
+        except Exception as e:
+            raise GenerationError(f"Failed to generate QR code: {e}")
+    
+    def _generate_entry(self, address: str, output_path: Optional[str]) -> Dict[str, Any]:
+        """Generate one batch entry, in memory when output_path is None"""
+        try:
+            if output_path is not None:
+                return self._write(address, output_path)
             
+            png, dimensions = self._encode(address)
         except Exception as e:
             raise GenerationError(f"Failed to generate QR code: {e}")
+        
+        return {
+            "bytes": png,
+            "size_bytes": len(png),
+            "size_formatted": format_file_size(len(png)),
+            "dimensions": dimensions,
+            "address": address,
+            "style": self._style_name()
+        }
     
-    def generate_batch(self, addresses: List[str], output_dir: str, 
-                      progress_callback=None) -> List[Dict[str, Any]]:
+    def generate_batch(self, addresses: List[str], output_dir: Optional[str], 
+                      progress_callback=None,
+                      max_workers: Optional[int] = None,
+                      as_bytes: bool = False) -> List[Dict[str, Any]]:
         """
         Generate multiple QR codes
         
+        Addresses are rendered serially unless max_workers is 2 or more,
+        which renders them in a pool of that many worker processes. With
+        as_bytes=True nothing is written: each result carries the PNG
+        under 'bytes' instead of a 'filepath', and output_dir is ignored.
+        
         Returns:
             List of generation results
         """
-        os.makedirs(output_dir, exist_ok=True)
+        # Validate once here; entries skip the per-call check in generate()
+        # (catching what generate() catches, so no raw error escapes)
+        try:
+            self.config.validate()
+        except Exception as e:
+            raise GenerationError(f"Failed to generate QR codes: {e}")
         
         results = []
         total = len(addresses)
         
-        for i, address in enumerate(addresses, 1):
-            try:
-                # Generate unique filename
-                filename = generate_filename(address, "batch", i)
-                output_path = os.path.join(output_dir, filename)
-                
-                # Generate QR
-                result = self.generate(address, output_path, show_info=False)
-                results.append(result)
-                
-                # Update progress
-                if progress_callback:
-                    progress_callback(i, total, address)
-                    
-            except Exception as e:
-                print(f"Error generating QR for address {i}: {e}")
+        if as_bytes:
+            jobs = [(address, None) for address in addresses]
+        else:
+            os.makedirs(output_dir, exist_ok=True)
+            
+            # Generate unique filenames up front so workers only render;
+            # join the directory once and concatenate per address
+            prefix = os.path.join(output_dir, "")
+            jobs = [
+                (address, prefix + generate_filename(address, "batch", i))
+                for i, address in enumerate(addresses, 1)
+            ]
+        
+        for i, (address, outcome) in enumerate(self._run_batch(jobs, max_workers), 1):
+            if isinstance(outcome, Exception):
+                print(f"Error generating QR for address {i}: {outcome}")
                 # Continue with next address
+                continue
+            
+            results.append(outcome)
+            
+            # Update progress
+            if progress_callback:
+                progress_callback(i, total, address)
         
-        return results
\ No newline at end of file
+        return results
+    
+    def _run_batch(self, jobs: List[Tuple[str, Optional[str]]],
+                   max_workers: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Yield (address, result or exception) for each job, in input order"""
+        workers = batch_worker_count(len(jobs), max_workers)
+        if workers == 1:
+            for address, output_path in jobs:
+                try:
+                    yield address, self._generate_entry(address, output_path)
+                except Exception as e:
+                    yield address, e
+            return
+        
+        # The config is shipped once per worker, not once per address
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT,
+                                 initializer=_init_worker, initargs=(self.config,)) as executor:
+            futures = [
+                executor.submit(_generate_one, job)
+                for job in jobs
+            ]
+            for (address, _), future in zip(jobs, futures):
+                try:
+                    yield address, future.result()
+                except Exception as e:
+                    yield address, e
+
+@lru_cache(maxsize=None)
+def get_default_generator() -> QRGenerator:
+    """
+    Process-wide QRGenerator with the default QRConfig, created on first call
+    
+    Every caller shares this instance; build a QRGenerator of your own to
+    change its config.
+    """
+    return QRGenerator(QRConfig())
+
+# Per-process generator for batch workers, set up by _init_worker
+_worker_generator: Optional[QRGenerator] = None
+
+def _init_worker(config: QRConfig):
+    """Build the batch worker's generator once when the process starts"""
+    global _worker_generator
+    _worker_generator = QRGenerator(config)
+
+def _generate_one(job: Tuple[str, Optional[str]]) -> Dict[str, Any]:
+    """Render a single batch entry in a worker process"""
+    address, output_path = job
+    return _worker_generator._generate_entry(address, output_path)
+
+@lru_cache(maxsize=None)
+def _font_candidates(bold: bool, italic: bool) -> Tuple[str, ...]:
+    """Existing font files for a style, best first (checked once per process)"""
+    # Try different font paths
+    if bold and italic:
+        font_paths = [
+            "arialbi.ttf", "Arial Bold Italic.ttf",
+            "/System/Library/Fonts/Arial Bold Italic.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationSans-BoldItalic.ttf"
+        ]
+    elif bold:
+        font_paths = [
+            "arialbd.ttf", "Arial Bold.ttf",
+            "/System/Library/Fonts/Arial Bold.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"
+        ]
+    elif italic:
+        font_paths = [
+            "ariali.ttf", "Arial Italic.ttf",
+            "/System/Library/Fonts/Arial Italic.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf"
+        ]
+    else:
+        font_paths = [
+            "arial.ttf", "Arial.ttf",
+            "/System/Library/Fonts/Arial.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
+        ]
+    
+    # Also try system fonts
+    font_paths.extend([
+        "DejaVuSans.ttf", "LiberationSans-Regular.ttf",
+        "Ubuntu-R.ttf", "Roboto-Regular.ttf"
+    ])
+    
+    return tuple(path for path in font_paths if os.path.exists(path))
+
+@lru_cache(maxsize=None)
+def _load_font(size: int, bold: bool = False, italic: bool = False) -> ImageFont.FreeTypeFont:
+    """Load a font once per (size, style) for every QRGenerator in the process"""
+    for font_path in _font_candidates(bold, italic):
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception:
+            continue
+    
+    # Final fallback
+    return ImageFont.load_default()
+
+@lru_cache(maxsize=None)
+def _emboss_colors(hex_color: str) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+    """Light and dark emboss shades of a #RRGGBB color, parsed once per color"""
+    r, g, b = [int(hex_color[i:i+2], 16) for i in (1, 3, 5)]
+    
+    # Light and dark versions for emboss
+    light_color = (min(255, r + 40), min(255, g + 40), min(255, b + 40))
+    dark_color = (max(0, r - 40), max(0, g - 40), max(0, b - 40))
+    return light_color, dark_color
+
+@lru_cache(maxsize=8)
+def _prepare_logo(logo_path: str, mtime_ns: int, logo_size: int) -> Tuple[Image.Image, Image.Image]:
+    """
+    Load, resize and mask a logo; cached per (path, mtime, size)
+    
+    Returns:
+        Tuple of (logo on a transparent square, circular paste mask)
+    """
+    logo = Image.open(logo_path).convert("RGBA")
+    
+    # Resize logo
+    logo = logo.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
+    
+    # Create circular mask for logo with shadow
+    mask_size = logo_size + 4
+    mask = Image.new("L", (mask_size, mask_size), 0)
+    draw = ImageDraw.Draw(mask)
+    
+    # Draw shadow (slightly larger circle)
+    draw.ellipse((2, 2, mask_size-2, mask_size-2), fill=100)
+    
+    # Draw main circle
+    draw.ellipse((0, 0, logo_size, logo_size), fill=255)
+    
+    # Create logo with white background
+    logo_bg = Image.new("RGBA", (mask_size, mask_size), (255, 255, 255, 0))
+    logo_pos = ((mask_size - logo_size) // 2, (mask_size - logo_size) // 2)
+    logo_bg.paste(logo, logo_pos, logo)
+    
+    return logo_bg, mask
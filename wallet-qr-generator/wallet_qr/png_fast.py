@@ -0,0 +1,47 @@
+"""
+Minimal PNG writer for plain two-color QR codes
+"""
+
+import struct
+import zlib
+from typing import List, Sequence, Tuple
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def _chunk(tag: bytes, data: bytes) -> bytes:
+    """Build a length-prefixed, CRC-suffixed PNG chunk"""
+    return (struct.pack(">I", len(data)) + tag + data +
+            struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+def encode_monochrome_png(rows: Sequence[Sequence[bool]], scale: int = 1,
+                          dark: Tuple[int, int, int] = (0, 0, 0),
+                          light: Tuple[int, int, int] = (255, 255, 255),
+                          compress_level: int = 1) -> bytes:
+    """
+    Encode a square module grid as a 1-bit palette PNG
+    
+    Each module becomes a scale x scale block; True modules use the dark
+    color and False modules the light one.
+    """
+    size = len(rows) * scale
+    row_bytes = (size + 7) // 8
+    padding = "0" * (row_bytes * 8 - size)
+    on, off = "1" * scale, "0" * scale
+    
+    scanlines: List[bytes] = []
+    for row in rows:
+        bits = "".join(on if module else off for module in row) + padding
+        # Filter type 0 (None) followed by the packed pixels
+        line = b"\x00" + int(bits, 2).to_bytes(row_bytes, "big")
+        scanlines.extend([line] * scale)
+    
+    header = struct.pack(">IIBBBBB", size, size, 1, 3, 0, 0, 0)
+    palette = bytes(light) + bytes(dark)
+    
+    return b"".join([
+        PNG_SIGNATURE,
+        _chunk(b"IHDR", header),
+        _chunk(b"PLTE", palette),
+        _chunk(b"IDAT", zlib.compress(b"".join(scanlines), compress_level)),
+        _chunk(b"IEND", b""),
+    ])
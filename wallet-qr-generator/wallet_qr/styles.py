@@ -2,42 +2,74 @@
 QR Code style definitions and templates
 """
 
-from dataclasses import dataclass, field
-from typing import Tuple, Optional, Dict, Any, List
-from enum import Enum
-import json
+from dataclasses import dataclass, field, fields, replace
+from typing import Tuple, Optional, Dict, Any, Iterator, List, NamedTuple
+from functools import lru_cache
+import pickle
+import sys
 
-class ColorScheme(Enum):
-    """Color scheme presets"""
-    BLUE = ("#2E86C1", "#F8F9F9", "#2C3E50", "Professional blue theme")
-    GREEN = ("#27AE60", "#F8F9F9", "#145A32", "Fresh green theme")
-    RED = ("#E74C3C", "#FDF2F0", "#922B21", "Vibrant red theme")
-    PURPLE = ("#8E44AD", "#F9F0FF", "#4A235A", "Royal purple theme")
-    DARK = ("#27AE60", "#1C2833", "#BDC3C7", "Dark mode theme")
-    GRADIENT = ("#FF6B6B", "#F8F9F9", "#2C3E50", "Gradient color theme")
-    GOLD = ("#F39C12", "#FEF9E7", "#7D6608", "Premium gold theme")
-    SILVER = ("#7F8C8D", "#F8F9F9", "#2C3E50", "Elegant silver theme")
+from .exceptions import ConfigError
+from .utils import dumps_json, load_config
+
+# Slotted dataclasses (no per-instance __dict__, faster attribute access) need
+# Python 3.10; older interpreters get regular dataclasses
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+class _Color(NamedTuple):
+    """One ColorScheme member"""
+    name: str
+    hex_color: str
+    background: str
+    text_color: str
+    description: str
     
     @property
-    def hex_color(self):
-        return self.value[0]
+    def value(self) -> Tuple[str, str, str, str]:
+        """(hex_color, background, text_color, description), as on the former Enum"""
+        return self[1:]
+
+class _ColorSchemeMeta(type):
+    """Makes ColorScheme iterable and indexable by member name, like an Enum"""
     
-    @property
-    def background(self):
-        return self.value[1]
+    def __new__(mcls, name, bases, namespace):
+        cls = super().__new__(mcls, name, bases, namespace)
+        # Members in definition order, by exact name for [] and by lowercased
+        # name for get()
+        cls._member_map = {key: value for key, value in namespace.items() if isinstance(value, _Color)}
+        cls._members_by_lower_name = {key.lower(): value for key, value in cls._member_map.items()}
+        return cls
     
-    @property
-    def text_color(self):
-        return self.value[2]
+    def __iter__(cls) -> Iterator[_Color]:
+        return iter(cls._member_map.values())
     
-    @property
-    def description(self):
-        return self.value[3]
+    def __len__(cls) -> int:
+        return len(cls._member_map)
+    
+    def __getitem__(cls, name: str) -> _Color:
+        # KeyError for unknown names, as Enum raises
+        return cls._member_map[name]
+
+class ColorScheme(metaclass=_ColorSchemeMeta):
+    """Color scheme presets (plain class attributes, so lookups skip Enum machinery)"""
+    BLUE = _Color("BLUE", "#2E86C1", "#F8F9F9", "#2C3E50", "Professional blue theme")
+    GREEN = _Color("GREEN", "#27AE60", "#F8F9F9", "#145A32", "Fresh green theme")
+    RED = _Color("RED", "#E74C3C", "#FDF2F0", "#922B21", "Vibrant red theme")
+    PURPLE = _Color("PURPLE", "#8E44AD", "#F9F0FF", "#4A235A", "Royal purple theme")
+    DARK = _Color("DARK", "#27AE60", "#1C2833", "#BDC3C7", "Dark mode theme")
+    GRADIENT = _Color("GRADIENT", "#FF6B6B", "#F8F9F9", "#2C3E50", "Gradient color theme")
+    GOLD = _Color("GOLD", "#F39C12", "#FEF9E7", "#7D6608", "Premium gold theme")
+    SILVER = _Color("SILVER", "#7F8C8D", "#F8F9F9", "#2C3E50", "Elegant silver theme")
+    
+    @classmethod
+    def get(cls, name: str) -> Optional[_Color]:
+        """Look up a scheme by case-insensitive name, None if unknown"""
+        return cls._members_by_lower_name.get(name.lower())
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class QRConfig:
     """QR code configuration"""
-    version: int = 5
+    version: Optional[int] = 5  # None = smallest version that fits
     error_correction: str = "H"  # L, M, Q, H
     box_size: int = 12
     border: int = 4
@@ -52,11 +84,60 @@ class QRConfig:
     logo_size: int = 80
     watermark: str = ""
     custom_css: Dict[str, Any] = field(default_factory=dict)
+    # Fixed mask pattern 0-7. None lets qrcode score all eight masks and pick
+    # the best one; pinning a mask skips that search (the bulk of encode time)
+    # at the cost of a possibly less scanner-friendly module layout.
+    mask: Optional[int] = None
+    # zlib level for PNG output: QR images are mostly flat runs, so level 1
+    # is nearly as small as 9 and much cheaper to encode
+    png_compress_level: int = 1
+    # Pillow's optimize pass re-compresses at level 9: roughly 40% smaller
+    # files for about 4x the encode cost, so it is off by default and best
+    # kept for one-off prints rather than batches
+    png_optimize: bool = False
+    # "pil" renders the full styled card; "fast" writes a plain two-color QR
+    # straight from the module matrix, skipping Pillow entirely
+    backend: str = "pil"
+    # Write buffer for image files; 64 KiB turns the PNG encoder's many small
+    # chunk writes into a few syscalls (the io default is only 8 KiB)
+    io_buffer_size: int = 64 * 1024
     
     @classmethod
     def from_preset(cls, preset: str) -> 'QRConfig':
         """Create config from preset"""
-        presets = {
+        template = _PRESETS.get(preset.lower())
+        if template is None:
+            # Default to professional if preset not found
+            return cls()
+        
+        # Hand out a copy so callers can tweak it without touching the cache
+        return replace(template, custom_css=dict(template.custom_css))
+    
+    def validate(self):
+        """Check every setting in one sweep, raising ConfigError on the first problem"""
+        # None lets qrcode pick the smallest version that fits the data
+        if self.version is not None and not 1 <= self.version <= 40:
+            raise ConfigError(f"QR version must be 1-40, got {self.version}")
+        if self.error_correction.upper() not in ("L", "M", "Q", "H"):
+            raise ConfigError(f"Error correction must be L, M, Q or H, got {self.error_correction!r}")
+        if self.box_size < 1:
+            raise ConfigError(f"Box size must be at least 1, got {self.box_size}")
+        if self.border < 0:
+            raise ConfigError(f"Border must not be negative, got {self.border}")
+        if self.mask is not None and not 0 <= self.mask <= 7:
+            raise ConfigError(f"Mask pattern must be 0-7, got {self.mask}")
+        if not 0 <= self.png_compress_level <= 9:
+            raise ConfigError(f"PNG compress level must be 0-9, got {self.png_compress_level}")
+        if self.backend not in ("pil", "fast"):
+            raise ConfigError(f"Backend must be 'pil' or 'fast', got {self.backend!r}")
+        if self.io_buffer_size < 0 or self.io_buffer_size == 1:
+            # buffering=1 means line buffering, which binary files don't support
+            raise ConfigError(f"I/O buffer size must be 0 or at least 2, got {self.io_buffer_size}")
+    
+    @classmethod
+    def _build_presets(cls) -> Dict[str, 'QRConfig']:
+        """Build preset templates (called once at import, see _PRESETS)"""
+        return {
             "professional": cls(
                 version=5,
                 error_correction="H",
@@ -134,41 +215,42 @@ class QRConfig:
                 add_logo=True,
                 logo_size=150,
                 watermark="VERIFIED"
+            ),
+            "fast": cls(
+                version=5,
+                error_correction="H",
+                box_size=10,
+                border=4,
+                fill_color="black",
+                title="",
+                show_address=False,
+                show_qr_border=False,
+                add_logo=False,
+                mask=2,
+                backend="fast"
             )
         }
-        
-        if preset.lower() in presets:
-            return presets[preset.lower()]
-        
-        # Default to professional if preset not found
-        return cls()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary"""
-        return {
-            "version": self.version,
-            "error_correction": self.error_correction,
-            "box_size": self.box_size,
-            "border": self.border,
-            "fill_color": self.fill_color,
-            "back_color": self.back_color,
-            "title": self.title,
-            "subtitle": self.subtitle,
-            "show_address": self.show_address,
-            "show_qr_border": self.show_qr_border,
-            "add_logo": self.add_logo,
-            "logo_path": self.logo_path,
-            "logo_size": self.logo_size,
-            "watermark": self.watermark,
-            "custom_css": self.custom_css
-        }
+        return {name: getattr(self, name) for name in _CONFIG_FIELDS}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'QRConfig':
         """Create config from dictionary"""
-        return cls(**data)
+        config = cls(**data)
+        # Don't alias the caller's nested dict
+        config.custom_css = dict(config.custom_css)
+        return config
+
+# Field names in declaration order, looked up once rather than per to_dict()
+_CONFIG_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(QRConfig))
 
-@dataclass
+# Preset name -> template QRConfig, built once at import; from_preset hands
+# out copies, so the templates themselves are never mutated
+_PRESETS: Dict[str, QRConfig] = QRConfig._build_presets()
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Layout:
     """Layout configuration"""
     width: int
@@ -230,10 +312,9 @@ class StyleManager:
     
     def _load_default_styles(self):
         """Load default style presets"""
-        self.styles = {
-            name: QRConfig.from_preset(name)
-            for name in ["professional", "minimalist", "dark", "gradient", "business", "premium"]
-        }
+        # Copies of the import-time templates, so editing a manager's styles
+        # never leaks into other managers or from_preset()
+        self.styles = {name: QRConfig.from_preset(name) for name in _PRESETS}
     
     def get_style(self, name: str) -> Optional[QRConfig]:
         """Get style by name"""
@@ -248,21 +329,44 @@ class StyleManager:
         return list(self.styles.keys())
     
     def save_styles(self, filepath: str):
-        """Save styles to file"""
+        """Save styles to file (pickle for *.pkl, JSON otherwise)"""
         styles_data = {
             name: config.to_dict()
             for name, config in self.styles.items()
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(styles_data, f, indent=2)
+        if filepath.endswith(".pkl"):
+            with open(filepath, 'wb') as f:
+                pickle.dump(styles_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            return
+        
+        with open(filepath, 'wb') as f:
+            f.write(dumps_json(styles_data))
     
     def load_styles(self, filepath: str):
-        """Load styles from file"""
-        with open(filepath, 'r') as f:
-            styles_data = json.load(f)
+        """
+        Load styles from file (pickle for *.pkl, JSON otherwise)
+        
+        Pickle files are faster to load but can run arbitrary code; only
+        load *.pkl style files you created yourself.
+        """
+        if filepath.endswith(".pkl"):
+            with open(filepath, 'rb') as f:
+                styles_data = pickle.load(f)
+        else:
+            styles_data = load_config(filepath)
         
         self.styles.update({
             name: QRConfig.from_dict(config_data)
             for name, config_data in styles_data.items()
-        })
\ No newline at end of file
+        })
+
+@lru_cache(maxsize=None)
+def get_style_manager() -> StyleManager:
+    """
+    Process-wide StyleManager, created on first call
+    
+    Every caller shares this instance; build a fresh StyleManager() to add
+    or load styles without affecting anyone else.
+    """
+    return StyleManager()
@@ -6,11 +6,43 @@ import os
 import sys
 import hashlib
 import json
+import mmap
 import re
+import signal
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
 import shutil
+from functools import lru_cache
+
+# Common crypto address patterns, compiled once and checked in order
+_ADDRESS_PATTERNS = (
+    (re.compile(r'^(bc1|[13])[a-zA-HJ-NP-Z0-9]{25,39}$'), "bitcoin"),
+    (re.compile(r'^0x[a-fA-F0-9]{40}$'), "ethereum"),
+    (re.compile(r'^[LM3][a-km-zA-HJ-NP-Z1-9]{26,33}$'), "litecoin"),
+    (re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$'), "solana"),
+    (re.compile(r'^[A-Za-z0-9+/]+={0,2}$'), "base64"),
+    (re.compile(r'^[A-Za-z0-9\-_+=/.]+$'), "generic"),
+)
+
+# The same patterns as one alternation of named groups: a single fullmatch
+# tries them in the order above and lastgroup names the one that matched
+_ADDRESS_ALTERNATION = "|".join(
+    f"(?P<{coin_type}>{pattern.pattern[1:-1]})" for pattern, coin_type in _ADDRESS_PATTERNS
+)
+_ADDRESS_RE = re.compile(_ADDRESS_ALTERNATION)
+
+# The alternation anchored per line, for scanning a whole file in a single
+# pass; each line must hold exactly one address (10+ characters)
+_ADDRESS_LINE_RE = re.compile(
+    r'^[^\S\n]*(?=\S{10})(?:%s)[^\S\n]*$' % _ADDRESS_ALTERNATION,
+    re.MULTILINE
+)
+_ADDRESS_LINE_RE_BYTES = re.compile(_ADDRESS_LINE_RE.pattern.encode(), re.MULTILINE)
+
+# Translation table deleting the whitespace no address may contain
+_WHITESPACE = str.maketrans("", "", " \t\r\n\f\v")
 
 def validate_wallet_address(address: str) -> Tuple[bool, str]:
     """
@@ -22,37 +54,73 @@ def validate_wallet_address(address: str) -> Tuple[bool, str]:
     if not address or len(address) < 10:
         return False, "invalid"
     
-    # Remove whitespace
+    # Surrounding whitespace is ignored; no pattern accepts any inside
     address = address.strip()
+    match = _ADDRESS_RE.fullmatch(address)
+    if match is not None:
+        return True, match.lastgroup
+    
+    if len(address.translate(_WHITESPACE)) != len(address):
+        return False, "invalid"
+    return False, "unknown"
+
+def find_wallet_addresses(text: Union[str, bytes, memoryview], pos: int = 0,
+                          endpos: int = sys.maxsize) -> Iterator[Tuple[str, str]]:
+    """
+    Scan text holding one address per line
     
-    # Common crypto address patterns
-    patterns = {
-        "bitcoin": r'^(bc1|[13])[a-zA-HJ-NP-Z0-9]{25,39}$',
-        "ethereum": r'^0x[a-fA-F0-9]{40}$',
-        "litecoin": r'^[LM3][a-km-zA-HJ-NP-Z1-9]{26,33}$',
-        "solana": r'^[1-9A-HJ-NP-Za-km-z]{32,44}$',
-        "base64": r'^[A-Za-z0-9+/]+={0,2}$',
-        "generic": r'^[A-Za-z0-9\-_+=/.]+$'
-    }
+    Bytes-like input (e.g. an mmap) is scanned without decoding; only the
+    matched addresses are decoded. pos/endpos limit the scan to a slice
+    without copying it and should fall on line boundaries.
     
-    for coin_type, pattern in patterns.items():
-        if re.match(pattern, address):
-            return True, coin_type
+    Each line is stripped of surrounding whitespace first, as the address
+    file loader always did, and must then hold one address of at least 10
+    characters. So a padded short line such as "  abcdefgh  " is skipped
+    even though validate_wallet_address accepts it unstripped.
     
-    return False, "unknown"
+    Yields:
+        (address, detected_type) for every line holding one address
+    """
+    if isinstance(text, str):
+        for match in _ADDRESS_LINE_RE.finditer(text, pos, endpos):
+            yield match.group(match.lastgroup), match.lastgroup
+    else:
+        for match in _ADDRESS_LINE_RE_BYTES.finditer(text, pos, endpos):
+            yield match.group(match.lastgroup).decode("ascii"), match.lastgroup
 
-def get_file_hash(filepath: str, algorithm: str = "sha256") -> str:
+def get_file_hash(filepath: str, algorithm: str = "sha256", chunk_size: int = 1 << 20) -> str:
     """
     Calculate hash of a file
+    
+    The file is memory-mapped and hashed in a single update; files mmap
+    refuses (empty files, pipes) are read in chunk_size blocks instead.
     """
     hash_func = getattr(hashlib, algorithm)()
     
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_func.update(chunk)
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash_func.update(mapped)
+        except (ValueError, OSError):
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                hash_func.update(chunk)
     
     return hash_func.hexdigest()
 
+def batch_worker_count(job_count: int, max_workers: Optional[int] = None) -> int:
+    """
+    Worker processes a batch of job_count addresses runs on
+    
+    Pools are opt-in: None (the default) and anything below 2 mean serial,
+    as do batches of 2 or fewer, where pool startup costs more than it saves.
+    
+    Returns:
+        Number of worker processes, 1 for serial generation
+    """
+    if max_workers is None or max_workers < 2 or job_count <= 2:
+        return 1
+    return min(max_workers, job_count)
+
 def create_output_dir(base_dir: str = "output", prefix: str = "qr_codes") -> str:
     """
     Create output directory with timestamp
@@ -63,14 +131,40 @@ def create_output_dir(base_dir: str = "output", prefix: str = "qr_codes") -> str
     os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
-def save_config(config: Dict[str, Any], output_dir: str) -> str:
+@lru_cache(maxsize=None)
+def _orjson():
+    """Import orjson on first use; None when it is not installed"""
+    try:
+        import orjson
+    except ImportError:  # optional speedup, see the "fast" extra
+        return None
+    return orjson
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, with orjson when it is installed"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def save_config(config: Dict[str, Any], output_dir: str, buffer_size: int = 64 * 1024) -> str:
     """
     Save configuration to JSON file
+    
+    The document is serialized up front and written with a single write
+    through a buffer_size buffer.
     """
     config_file = os.path.join(output_dir, "generation_config.json")
     
-    with open(config_file, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    with open(config_file, 'wb', buffering=buffer_size) as f:
+        f.write(dumps_json(config))
     
     return config_file
 
@@ -78,14 +172,13 @@ def load_config(config_file: str) -> Dict[str, Any]:
     """
     Load configuration from JSON file
     """
-    with open(config_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # One binary read; orjson (if installed) parses it without building
+    # intermediate str objects
+    with open(config_file, 'rb') as f:
+        return loads_json(f.read())
 
-def print_banner():
-    """
-    Print ASCII art banner
-    """
-    banner = """
+# Startup banner, newline included, as print() would have written it
+_BANNER = """
     ╔══════════════════════════════════════════════════════════╗
     ║                                                          ║
     ║    ██████╗ ██████╗ ██╗   ██╗██████╗ ████████╗ ██████╗   ║
@@ -99,24 +192,35 @@ def print_banner():
     ║                G E N E R A T O R   v1.0.0                ║
     ║                                                          ║
     ╚══════════════════════════════════════════════════════════╝
+    """ + "\n"
+
+def print_banner():
+    """
+    Print ASCII art banner
     """
-    print(banner)
+    sys.stdout.write(_BANNER)
+
+# Colored status line templates, each written with a single write() call
+_SUCCESS_LINE = "\033[92m✓ %s\033[0m\n"
+_ERROR_LINE = "\033[91m✗ %s\033[0m\n"
+_WARNING_LINE = "\033[93m⚠ %s\033[0m\n"
+_INFO_LINE = "\033[94mℹ %s\033[0m\n"
 
 def print_success(message: str):
     """Print success message in green"""
-    print(f"\033[92m✓ {message}\033[0m")
+    sys.stdout.write(_SUCCESS_LINE % (message,))
 
 def print_error(message: str):
     """Print error message in red"""
-    print(f"\033[91m✗ {message}\033[0m")
+    sys.stdout.write(_ERROR_LINE % (message,))
 
 def print_warning(message: str):
     """Print warning message in yellow"""
-    print(f"\033[93m⚠ {message}\033[0m")
+    sys.stdout.write(_WARNING_LINE % (message,))
 
 def print_info(message: str):
     """Print info message in blue"""
-    print(f"\033[94mℹ {message}\033[0m")
+    sys.stdout.write(_INFO_LINE % (message,))
 
 class ProgressBar:
     """Professional progress bar implementation"""
@@ -131,55 +235,154 @@ class ProgressBar:
         self.show_percent = show_percent
         self.current = 0
         self.start_time = datetime.now()
+        
+        # Each frame slices these instead of building two new bar strings
+        self._full_bar = fill * length
+        self._empty_bar = '─' * length
+        self._stream = sys.stdout
+        self._last_line = None
     
     def update(self, progress: int = 1):
         """Update progress bar"""
         self.current += progress
-        percent = f"{100 * (self.current / float(self.total)):3.1f}"
         
         filled_length = int(self.length * self.current // self.total)
-        bar = self.fill * filled_length + '─' * (self.length - filled_length)
+        bar = self._full_bar[:filled_length] + self._empty_bar[filled_length:]
         
+        # Each frame is a single f-string (one BUILD_STRING, no intermediates)
         if self.show_percent:
-            print(f'\r{self.prefix} │{bar}│ {percent}% {self.suffix}', end='\r')
+            percent = 100 * (self.current / float(self.total))
+            line = f'\r{self.prefix} │{bar}│ {percent:3.1f}% {self.suffix}\r'
         else:
-            print(f'\r{self.prefix} │{bar}│ {self.current}/{self.total} {self.suffix}', end='\r')
+            line = f'\r{self.prefix} │{bar}│ {self.current}/{self.total} {self.suffix}\r'
         
         if self.current == self.total:
             elapsed = datetime.now() - self.start_time
-            print(f'\r{self.prefix} │{self.fill * self.length}│ Done in {elapsed.total_seconds():.1f}s     ')
+            line += f'\r{self.prefix} │{self._full_bar}│ Done in {elapsed.total_seconds():.1f}s     \n'
+        elif line == self._last_line:
+            # Nothing visible changed since the last frame; skip the write
+            return
+        
+        # One write per frame (print would issue a second one for end='\r')
+        self._last_line = line
+        self._stream.write(line)
+        if self.current == self.total:
+            self._stream.flush()
     
     def finish(self):
         """Force finish the progress bar"""
         self.update(self.total - self.current)
 
+# Cursor home, clear screen, clear scrollback: what `clear` prints on xterm
+_CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+
+@lru_cache(maxsize=None)
+def _ansi_console() -> bool:
+    """Whether stdout understands ANSI escapes; turns them on in Windows 10+ consoles"""
+    if os.name != 'nt':
+        return True
+    
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
 def clear_screen():
     """Clear terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # An escape sequence instead of spawning a shell to run clear/cls
+    if _ansi_console():
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+# Last measured terminal width; None until measured and after every resize
+_terminal_width: Optional[int] = None
+# Set once watch_terminal_resizes() has installed its SIGWINCH handler
+_watching_resizes = False
+
+def watch_terminal_resizes() -> bool:
+    """
+    Let get_terminal_width() cache the width until the window is resized
+    
+    Installs a SIGWINCH handler that forgets the cached width and then runs
+    whatever handler was installed before it. Meant for application entry
+    points (the CLI's main() calls it); does nothing off the main thread or
+    where SIGWINCH does not exist.
+    
+    Returns:
+        True if resizes are being watched
+    """
+    global _watching_resizes
+    if _watching_resizes:
+        return True
+    
+    sigwinch = getattr(signal, "SIGWINCH", None)
+    if sigwinch is None or threading.current_thread() is not threading.main_thread():
+        return False
+    
+    previous = signal.getsignal(sigwinch)
+    
+    def _on_resize(signum, frame):
+        global _terminal_width
+        _terminal_width = None
+        # Chain to the handler we replaced
+        if callable(previous):
+            previous(signum, frame)
+    
+    signal.signal(sigwinch, _on_resize)
+    _watching_resizes = True
+    return True
 
 def get_terminal_width() -> int:
-    """Get terminal width in characters"""
+    """Get terminal width in characters (cached once watch_terminal_resizes() runs)"""
+    global _terminal_width
+    if _terminal_width is not None:
+        return _terminal_width
+    
     try:
-        return shutil.get_terminal_size().columns
-    except:
-        return 80
+        width = shutil.get_terminal_size().columns
+    except OSError:
+        width = 80
+    
+    # Only cache when a resize can clear it again
+    if _watching_resizes:
+        _terminal_width = width
+    return width
 
-def format_file_size(bytes_size: int) -> str:
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_SIZE_DIVISORS = (1, 1024, 1024 ** 2, 1024 ** 3, 1024 ** 4)
+
+def format_file_size(bytes_size: float) -> str:
     """Format file size in human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0 # type: ignore
-    return f"{bytes_size:.1f} TB"
+    # Every 10 bits is one more factor of 1024, so the unit comes straight
+    # from the bit length (flooring first keeps the cut-offs exact for floats)
+    index = min((max(int(bytes_size), 1).bit_length() - 1) // 10, 4)
+    return f"{bytes_size / _SIZE_DIVISORS[index]:.1f} {_SIZE_UNITS[index]}"
+
+# Characters replaced in the style part of generated filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-]')
+
+@lru_cache(maxsize=1024)
+def _short_hash(address: str) -> str:
+    """8 hex chars identifying an address in filenames, hashed once per address"""
+    return hashlib.md5(address.encode()).hexdigest()[:8]
 
 def generate_filename(address: str, style: str, index: int = None) -> str: # type: ignore
     """Generate consistent filename for QR code"""
     # Create short hash from address
-    short_hash = hashlib.md5(address.encode()).hexdigest()[:8]
+    short_hash = _short_hash(address)
     
     # Remove special characters for filename safety
-    safe_style = re.sub(r'[^\w\-]', '_', style)
+    safe_style = _UNSAFE_FILENAME_CHARS.sub('_', style)
     
     if index is not None:
         return f"qr_{index:03d}_{safe_style}_{short_hash}.png"
-    return f"qr_{safe_style}_{short_hash}.png"
\ No newline at end of file
+    return f"qr_{safe_style}_{short_hash}.png"